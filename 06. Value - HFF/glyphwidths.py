@@ -0,0 +1,142 @@
+import hashlib
+import json
+import os
+import unicodedata
+
+# Display widths for the Transmission layout. A WidthTable maps characters to
+# advance widths in integer units (font units, or cells when there is no
+# font), so measuring a frame is a dict lookup per character and sums stay
+# exact. Tables built from a font file are cached on disk as JSON, fontTools
+# is only needed the first time a font is used. Characters a font has no glyph
+# for (Lucida Console has no superscripts, for one) are measured with fallback
+# fonts, like the renderer's font fallback would draw them.
+
+CACHE_DIR = os.path.join(
+    os.environ.get("XDG_CACHE_HOME") or os.path.join(os.path.expanduser("~"), ".cache"), "transmission-widths")
+
+# Unicode spaces (see spacesss.html) that can make up the part of the padding
+# that is narrower than a whole space
+FILL_SPACES = "\u2002\u2004\u2005\u2006\u2007\u2008\u2009\u200a\u202f\u205f"
+
+
+def estimate_cells(char):
+    """Width in cells of a character without looking at a font."""
+    if unicodedata.category(char) in ("Mn", "Me", "Cf"):
+        return 0  # combining marks, zero width spaces, joiners ...
+    if unicodedata.east_asian_width(char) in ("W", "F"):
+        return 2
+    return 1
+
+
+class WidthTable:
+    """Advance width of every character, in units where a space is `space`.
+
+    Characters the table doesn't list get default(char) cells, results are
+    remembered so every later lookup is a single dict access.
+    """
+
+    def __init__(self, advances=None, space=1, default=estimate_cells, name="estimated"):
+        self.advances = dict(advances or {})
+        self.space = space
+        self.default = default
+        self.name = name
+        self._fill = None
+
+    def width(self, char):
+        advance = self.advances.get(char)
+        if advance is None:
+            advance = self.advances[char] = self.default(char) * self.space
+        return advance
+
+    def text_width(self, text):
+        return sum(map(self.width, text))
+
+    def padding(self, units):
+        """Spaces covering `units`: whole spaces, plus the narrower Unicode
+        space closest to whatever is left over."""
+        count, rest = divmod(max(0, units), self.space)
+        if not rest:
+            return " " * count
+        if self._fill is None:
+            self._fill = [(self.width(char), char) for char in FILL_SPACES
+                          if 0 < self.width(char) < self.space]
+        best, fill = rest, ""
+        if self.space - rest < best:
+            best, fill = self.space - rest, " "
+        for advance, char in self._fill:
+            if abs(rest - advance) < best:
+                best, fill = abs(rest - advance), char
+        return " " * count + fill
+
+
+# Every character one cell wide: plain code point counting, like str.rjust
+CODE_POINTS = WidthTable(default=lambda char: 1, name="code points")
+
+
+def _cache_path(font_path, cache_dir):
+    stat = os.stat(font_path)
+    key = f"{os.path.abspath(font_path)}|{stat.st_size}|{stat.st_mtime_ns}"
+    digest = hashlib.sha1(key.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.splitext(os.path.basename(font_path))[0]}-{digest}.json")
+
+
+def build_advances(font_path):
+    """{codepoint: advance} and units per em, read with fontTools."""
+    try:
+        from fontTools.ttLib import TTFont
+    except ImportError:
+        raise RuntimeError("Reading a font needs fontTools (pip install fonttools), "
+                           "or leave out the font to estimate widths") from None
+    try:
+        font = TTFont(font_path, lazy=True, fontNumber=0)
+        try:
+            cmap = font.getBestCmap() or {}
+            metrics = font["hmtx"].metrics
+            units_per_em = font["head"].unitsPerEm
+            advances = {codepoint: metrics[glyph][0] for codepoint, glyph in cmap.items()}
+        finally:
+            font.close()
+    except OSError:
+        raise
+    except Exception as e:
+        # TTLibError, or whatever a damaged table trips over
+        raise ValueError(f"{font_path}: can't read font ({e})") from e
+    return advances, units_per_em
+
+
+def load_advances(font_path, cache_dir=CACHE_DIR):
+    """build_advances, from the cache if the font hasn't changed."""
+    cache_path = _cache_path(font_path, cache_dir)
+    try:
+        with open(cache_path, encoding="utf-8") as f:
+            cached = json.load(f)
+        advances = {int(codepoint): advance for codepoint, advance in cached["advances"].items()}
+        units_per_em = cached["units_per_em"]
+    except (OSError, ValueError, KeyError):
+        advances, units_per_em = build_advances(font_path)
+        os.makedirs(cache_dir, exist_ok=True)
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump({"font": os.path.basename(font_path), "units_per_em": units_per_em,
+                       "advances": advances}, f)
+        os.replace(temp_path, cache_path)
+    return advances, units_per_em
+
+
+def load_font_table(font_path, cache_dir=CACHE_DIR, fallbacks=()):
+    """WidthTable for a font file.
+
+    Characters the font has no glyph for are measured with the first of the
+    fallbacks font files that has one, scaled to the font's units per em.
+    """
+    advances, units_per_em = load_advances(font_path, cache_dir)
+    if 0x20 not in advances:
+        raise ValueError(f"{font_path}: font has no space glyph")
+    for fallback in fallbacks:
+        fallback_advances, fallback_units = load_advances(fallback, cache_dir)
+        for codepoint, advance in fallback_advances.items():
+            if codepoint not in advances:
+                advances[codepoint] = round(advance * units_per_em / fallback_units)
+    return WidthTable({chr(codepoint): advance for codepoint, advance in advances.items()},
+                      space=advances[0x20],
+                      name=" + ".join(os.path.basename(path) for path in (font_path, *fallbacks)))
@@ -0,0 +1,283 @@
+import argparse
+import math
+import os
+import re
+import sys
+from collections import deque
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from snaketools.asswriter import AssWriter, DEFAULT_FIELDS
+from snaketools.timebase import TICKS_PER_SECOND, parse_time
+from glyphwidths import CODE_POINTS, WidthTable, load_font_table
+
+# Scrolling ticker frames for the Transmission text, shared by
+# transmissiontext.py (word by word) and transmissioncharacters.py (character
+# by character). The visible window lives in a deque trimmed to the line
+# width, so each frame costs one window's worth of work however long the text
+# is, and the frames are yielded one at a time instead of collected. Widths
+# are code points unless a WidthTable from glyphwidths.py says otherwise. The
+# frames can be timed and written straight into an .ass file as Dialogue
+# events. main() is the command line of both scripts, nothing here needs a
+# display.
+
+BREAK = "<br>"
+BREAK_SPACES = "          "  # a <br> scrolls the text 10 spaces further
+
+# Styles the tickers use in Value - HFF.ass, written into generated files
+STYLES = {
+    "Transmission": "Style: Transmission,Lucida Console,80,&H00FFFFFF,&H00000000,&H18000000,&H15000000,"
+                    "0,0,0,0,100,100,0.0,0,3,1,1,2,10,10,10,1",
+    "Transmission_WHITE": "Style: Transmission_WHITE,Lucida Console,80,&H00000000,&H00FFFFFF,&H18FFFFFF,&H15FFFFFF,"
+                          "0,0,0,0,100,100,0.0,0,3,1,1,2,10,10,10,1",
+}
+
+HEADER = """[Script Info]
+ScriptType: v4.00+
+ScaledBorderAndShadow: Yes
+PlayResX: 2560
+PlayResY: 1440
+WrapStyle: 2
+
+[V4+ Styles]
+Format: Name, Fontname, Fontsize, PrimaryColour, SecondaryColour, OutlineColour, BackColour, Bold, Italic, Underline, StrikeOut, ScaleX, ScaleY, Spacing, Angle, BorderStyle, Outline, Shadow, Alignment, MarginL, MarginR, MarginV, Encoding
+{styles}
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"""
+
+
+class TickerWindow:
+    """The visible part of a ticker, right-aligned in `width` units.
+
+    Characters are dropped from the left once they no longer fit, measured
+    with a WidthTable (code points by default), so appending is amortised
+    O(1) and nothing outside the window is kept.
+    """
+
+    def __init__(self, width, widths=CODE_POINTS):
+        self.chars = deque()
+        self.used = 0
+        self.width = width
+        self.widths = widths
+
+    def append(self, char):
+        self.chars.append(char)
+        self.used += self.widths.width(char)
+        while self.used > self.width:
+            self.used -= self.widths.width(self.chars.popleft())
+
+    def extend(self, text):
+        for char in text:
+            self.append(char)
+
+    def lstrip(self):
+        while self.chars and self.chars[0].isspace():
+            self.used -= self.widths.width(self.chars.popleft())
+
+    def render(self):
+        return self.widths.padding(self.width - self.used) + "".join(self.chars)
+
+
+def word_frames(input_text, line_length=55, corner="l\u200bl", widths=CODE_POINTS):
+    """Yield one frame per word of input_text, each new word entering on the right.
+
+    line_length is in cells (spaces), widths the WidthTable to measure with.
+    """
+    window = TickerWindow(line_length * widths.space - 2 * widths.text_width(corner), widths)
+    started = False
+    for word in input_text.split():
+        if word == BREAK:
+            window.extend(BREAK_SPACES)
+        else:
+            if started:
+                window.append(" ")
+            window.extend(word)
+            # Leading spaces only ever show up as padding, a new word drops them
+            window.lstrip()
+        started = True
+        yield f"{corner} {window.render()} {corner}"
+
+
+def char_frames(input_text, line_length=16, corner="\u200b", widths=CODE_POINTS):
+    """Yield one frame per character of input_text."""
+    window = TickerWindow(line_length * widths.space - 2 * (widths.text_width(corner) + widths.space), widths)
+    for char in input_text.replace(BREAK, BREAK_SPACES):
+        window.append(char)
+        yield f"{corner}{window.render()}{corner}"
+
+
+MODES = {"word": word_frames, "char": char_frames}
+
+
+def frame_count(input_text, mode="word"):
+    """Number of frames word_frames/char_frames yield for input_text."""
+    if mode == "word":
+        return sum(1 for _ in re.finditer(r"\S+", input_text))
+    return len(input_text) - (len(BREAK) - len(BREAK_SPACES)) * input_text.count(BREAK)
+
+
+def frame_period(count, start, end=None, rate=None, bpm=None, beats=1):
+    """Centiseconds per frame, exactly, from one of:
+
+    end: spread the count frames evenly up to end (centiseconds)
+    rate: frames (words or characters) per second
+    bpm: one frame every `beats` beats at this tempo
+    """
+    if end is not None:
+        if end <= start:
+            raise ValueError("end has to be after start")
+        return Fraction(end - start) / max(count, 1)
+    if rate is not None:
+        if rate <= 0:
+            raise ValueError("rate has to be positive")
+        return TICKS_PER_SECOND / Fraction(rate)
+    if bpm is not None:
+        if bpm <= 0 or beats <= 0:
+            raise ValueError("bpm and beats have to be positive")
+        return 60 * TICKS_PER_SECOND * Fraction(beats) / Fraction(bpm)
+    raise ValueError("one of end, rate or bpm is needed")
+
+
+def to_ticks(time):
+    """Centiseconds from 'H:MM:SS.cc' (or looser, see parse_time) or a number."""
+    return parse_time(time) if isinstance(time, str) else int(time)
+
+
+def timed_frames(frames, start, period):
+    """Yield (start, end, frame) with each frame shown until the next one.
+
+    Times are rounded from the exact period, so long blocks don't drift.
+    """
+    for i, frame in enumerate(frames):
+        yield (start + math.floor(i * period + Fraction(1, 2)),
+               start + math.floor((i + 1) * period + Fraction(1, 2)),
+               frame)
+
+
+def ticker_events(input_text, mode="word", style="Transmission", start=0, end=None,
+                  rate=None, bpm=None, beats=1, **layout):
+    """Yield (start, end, fields, text) Dialogue events for one ticker block.
+
+    start and end are centiseconds or timestamps, layout is passed on to
+    word_frames/char_frames (line_length, corner, widths).
+    """
+    start = to_ticks(start)
+    end = None if end is None else to_ticks(end)
+    period = frame_period(frame_count(input_text, mode), start, end, rate, bpm, beats)
+    fields = (DEFAULT_FIELDS[0], style) + DEFAULT_FIELDS[2:]
+    for frame_start, frame_end, frame in timed_frames(MODES[mode](input_text, **layout), start, period):
+        yield frame_start, frame_end, fields, frame
+
+
+def write_ass(path, events, header=True):
+    """Stream events from ticker_events into an .ass file, returns the event count.
+
+    With header the file is a complete script with the Transmission styles,
+    without it only holds the Dialogue lines for pasting into another one.
+    """
+    with AssWriter(path) as out:
+        if header:
+            out.write_line(HEADER.format(styles="\n".join(STYLES.values())))
+        for start, end, fields, text in events:
+            out.write_event(start, end, text, fields)
+        return out.count - header
+
+
+def copy_to_clipboard(text):
+    """Put text on the clipboard. Tk is only imported here, so everything
+    else runs on machines without a display."""
+    from tkinter import Tk
+    r = Tk()
+    r.withdraw()
+    r.clipboard_clear()
+    r.clipboard_append(text)
+    r.update() # now it stays on the clipboard after the window is closed
+    r.destroy()
+
+
+def unescape(value):
+    # \uXXXX in arguments, zero width spaces are hard to type in a shell
+    return re.sub(r"\\u([0-9a-fA-F]{4})", lambda m: chr(int(m.group(1), 16)), value)
+
+
+def read_text(args, default_text):
+    if args.input:
+        with open(args.input, encoding='utf-8') as f:
+            text = f.read()
+    elif args.text == "-":
+        text = sys.stdin.read()
+    elif args.text is not None:
+        text = unescape(args.text)
+    else:
+        return default_text
+    # One ticker per input, line breaks are just spaces
+    return " ".join(text.splitlines())
+
+
+def build_parser(mode):
+    parser = argparse.ArgumentParser(
+        description=f"Scrolling Transmission ticker, one frame per {'word' if mode == 'word' else 'character'}.")
+    parser.add_argument('text', nargs='?',
+                        help='Text to scroll, - reads stdin (default: the example text in the script)')
+    parser.add_argument('-i', '--input', help='Read the text from this file')
+    parser.add_argument('--mode', choices=sorted(MODES), default=mode,
+                        help=f'One frame per word or per character (default: {mode})')
+    parser.add_argument('--line-length', type=int, help='Frame width in characters, corners included')
+    parser.add_argument('--corner', type=unescape, help='Frame corners, \\uXXXX escapes allowed')
+    measure = parser.add_mutually_exclusive_group()
+    measure.add_argument('--font', action='append',
+                         help='Pad and truncate by the advance widths of this font file (needs fontTools '
+                              'the first time, then cached). Repeat to add fallback fonts for the characters '
+                              'the first one has no glyph for')
+    measure.add_argument('--estimate-widths', action='store_true',
+                         help='Pad by estimated display widths (zero width and wide characters) without a font')
+    parser.add_argument('-o', '--output',
+                        help='Write timed Dialogue events to this .ass file instead of printing the frames')
+    parser.add_argument('--start', default="0:00:00.00", help='Start of the first frame (H:MM:SS.cc)')
+    timing = parser.add_mutually_exclusive_group()
+    timing.add_argument('--end', help='Spread the frames evenly up to this time')
+    timing.add_argument('--rate', type=Fraction, help='Frames per second')
+    timing.add_argument('--bpm', type=Fraction, help='Frames on the beat at this tempo')
+    parser.add_argument('--beats', type=Fraction, default=1, help='With --bpm, beats per frame (default: 1)')
+    parser.add_argument('--style', default="Transmission", help='Event style (default: Transmission)')
+    parser.add_argument('--events-only', action='store_true',
+                        help='Only write the Dialogue lines, no script header')
+    parser.add_argument('--clipboard', action='store_true', help='Also copy the frames to the clipboard')
+    return parser
+
+
+def main(mode="word", default_text="", argv=None):
+    parser = build_parser(mode)
+    args = parser.parse_args(argv)
+    text = read_text(args, default_text)
+    layout = {}
+    if args.line_length is not None:
+        layout["line_length"] = args.line_length
+    if args.corner is not None:
+        layout["corner"] = args.corner
+    if args.font:
+        try:
+            layout["widths"] = load_font_table(args.font[0], fallbacks=args.font[1:])
+        except (OSError, RuntimeError, ValueError) as e:
+            parser.error(str(e))
+    elif args.estimate_widths:
+        layout["widths"] = WidthTable()
+
+    if args.output:
+        if args.end is None and args.rate is None and args.bpm is None:
+            parser.error("--output needs --end, --rate or --bpm to time the frames")
+        try:
+            events = ticker_events(text, args.mode, args.style, args.start, args.end,
+                                   args.rate, args.bpm, args.beats, **layout)
+            count = write_ass(args.output, events, header=not args.events_only)
+        except ValueError as e:
+            parser.error(str(e))
+        print(f"Wrote {count} events to {args.output}", file=sys.stderr)
+    else:
+        for line in MODES[args.mode](text, **layout):
+            print(line)
+
+    if args.clipboard:
+        copy_to_clipboard("\n".join(MODES[args.mode](text, **layout)))
+    return 0
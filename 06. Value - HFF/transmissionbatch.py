@@ -0,0 +1,160 @@
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from fractions import Fraction
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+from snaketools.asswriter import AssWriter, format_event
+from snaketools.timebase import seconds_to_ticks
+from glyphwidths import WidthTable, load_font_table
+from transmission import HEADER, MODES, STYLES, ticker_events
+
+# Renders every transmission block of a set from one manifest into a single
+# .ass file, instead of editing input_text and rerunning a script per block.
+# Blocks are independent, so they are rendered in a process pool and written
+# in manifest order. The manifest is JSON, or YAML if PyYAML is installed:
+#
+#   defaults:                 # optional, merged into every block
+#     style: Transmission
+#   blocks:
+#     - text: "The Incident is reported last night, ..."
+#       start: "0:32:38.89"
+#       end: "0:33:41.90"     # or rate: frames per second, or bpm (+ beats)
+#     - text_file: scream.txt # relative to the manifest
+#       mode: char
+#       start: "0:34:03.14"
+#       rate: 12
+#       style: Transmission_WHITE
+#       corner: "\u200b"
+#
+# start and end are timestamps, or numbers of seconds. An unquoted 0:32:38.89
+# is a number of seconds to YAML (1958.89), so it ends up at the same time.
+# Other block keys: line_length, font (advance widths from a font file, or a
+# list of them, the rest being fallbacks) and estimate_widths, see
+# transmission.py.
+
+BLOCK_KEYS = {"text", "text_file", "mode", "style", "start", "end", "rate", "bpm", "beats",
+              "line_length", "corner", "font", "estimate_widths"}
+
+
+def load_manifest(path):
+    """[block dict, ...] from a JSON or YAML manifest, with defaults applied
+    and text_file read."""
+    with open(path, encoding='utf-8') as f:
+        if os.path.splitext(path)[1].lower() in (".yaml", ".yml"):
+            try:
+                import yaml
+            except ImportError:
+                raise ValueError("YAML manifests need PyYAML (pip install pyyaml), or use JSON") from None
+            manifest = yaml.safe_load(f)
+        else:
+            manifest = json.load(f)
+
+    if isinstance(manifest, list):
+        manifest = {"blocks": manifest}
+    if not isinstance(manifest, dict):
+        raise ValueError("the manifest has to be a list of blocks or hold defaults and blocks")
+    defaults = manifest.get("defaults") or {}
+    if not isinstance(defaults, dict):
+        raise ValueError("defaults has to be a mapping of block keys")
+    base = os.path.dirname(os.path.abspath(path))
+    blocks = []
+    for i, entry in enumerate(manifest.get("blocks") or [], 1):
+        if not isinstance(entry, dict):
+            raise ValueError(f"block {i}: has to be a mapping of block keys")
+        block = {**defaults, **entry}
+        unknown = set(block) - BLOCK_KEYS
+        if unknown:
+            raise ValueError(f"block {i}: unknown key(s) {', '.join(sorted(unknown))}")
+        if "text_file" in block:
+            with open(os.path.join(base, block.pop("text_file")), encoding='utf-8') as f:
+                block["text"] = " ".join(f.read().splitlines())
+        if "text" not in block or "start" not in block:
+            raise ValueError(f"block {i}: needs text (or text_file) and start")
+        if not any(key in block for key in ("end", "rate", "bpm")):
+            raise ValueError(f"block {i}: needs end, rate or bpm")
+        for key in ("start", "end"):
+            value = block.get(key)
+            if isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+                raise ValueError(f"block {i}: {key} has to be a timestamp or a number of seconds")
+            if isinstance(value, (int, float)):
+                block[key] = seconds_to_ticks(value)  # ticker_events takes numbers as centiseconds
+        # Types are checked here, the workers would only fail with a traceback
+        for key in ("text", "mode", "style", "corner"):
+            if key in block and not isinstance(block[key], str):
+                raise ValueError(f"block {i}: {key} has to be a string")
+        if block.get("mode", "word") not in MODES:
+            raise ValueError(f"block {i}: mode has to be one of {', '.join(sorted(MODES))}")
+        for key in ("rate", "bpm", "beats"):
+            value = block.get(key)
+            if value is not None and (isinstance(value, bool) or not isinstance(value, (int, float))):
+                raise ValueError(f"block {i}: {key} has to be a number")
+        if "line_length" in block:
+            value = block["line_length"]
+            if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+                raise ValueError(f"block {i}: line_length has to be a positive whole number")
+        if "font" in block:
+            fonts = [block["font"]] if isinstance(block["font"], str) else block["font"]
+            if not isinstance(fonts, list) or not fonts or not all(isinstance(font, str) for font in fonts):
+                raise ValueError(f"block {i}: font has to be a font file or a list of them")
+            block["font"] = [os.path.join(base, font) for font in fonts]
+        blocks.append(block)
+    return blocks
+
+
+def render_block(block):
+    """Formatted Dialogue lines of one block, runs in the worker processes."""
+    layout = {key: block[key] for key in ("line_length", "corner") if key in block}
+    if "font" in block:
+        layout["widths"] = load_font_table(block["font"][0], fallbacks=block["font"][1:])
+    elif block.get("estimate_widths"):
+        layout["widths"] = WidthTable()
+    events = ticker_events(
+        block["text"], block.get("mode", "word"), block.get("style", "Transmission"),
+        block["start"], block.get("end"),
+        None if block.get("rate") is None else Fraction(str(block["rate"])),
+        None if block.get("bpm") is None else Fraction(str(block["bpm"])),
+        Fraction(str(block.get("beats", 1))), **layout)
+    return [format_event(start, end, text, fields) for start, end, fields, text in events]
+
+
+def render_manifest(blocks, output_file, workers=None, header=True):
+    """Render all blocks into output_file, returns the number of events."""
+    with AssWriter(output_file) as out:
+        if header:
+            out.write_line(HEADER.format(styles="\n".join(STYLES.values())))
+        if workers == 1 or len(blocks) < 2:
+            for block in blocks:
+                out.write_lines(render_block(block))
+        else:
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                for lines in pool.map(render_block, blocks):
+                    out.write_lines(lines)
+        return out.count - header
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Render all transmission blocks of a JSON/YAML manifest into one .ass file.')
+    parser.add_argument('manifest', help='Manifest file (.json, .yaml or .yml)')
+    parser.add_argument('-o', '--output', required=True, help='Output .ass file')
+    parser.add_argument('-j', '--jobs', type=int, default=0,
+                        help='Render blocks in N processes (default: 0 = one per CPU)')
+    parser.add_argument('--events-only', action='store_true',
+                        help='Only write the Dialogue lines, no script header')
+    args = parser.parse_args(argv)
+
+    try:
+        blocks = load_manifest(args.manifest)
+        count = render_manifest(blocks, args.output, args.jobs or None, header=not args.events_only)
+    except (OSError, RuntimeError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    print(f"{len(blocks)} blocks, {count} events -> {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
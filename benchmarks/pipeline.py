@@ -0,0 +1,209 @@
+"""Throughput and memory benchmark for the snake generators.
+
+Runs the snakev3 core stage by stage (parse -> sample -> format -> write)
+over the archive's .ass files and over synthetic anchor sets, and reports
+time, throughput and peak traced memory per stage. The staged run holds every
+line in memory between stages, so the "generate" row also runs
+generate_file, which streams segment by segment like the UI and CLI do; its
+peak memory is the one users see. snake.py and snakev2.py are only timed end
+to end as subprocesses, with their peak RSS, they have no per-stage rows.
+They only read MidForSymbols anchors and exit early without writing
+anything when there are fewer than two, those runs are reported as n/a.
+Run from the repo root:
+
+    python benchmarks/pipeline.py [--sizes 1000 10000 100000 1000000] [--json results.json]
+"""
+import argparse
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from snaketools.core import (  # noqa: E402
+    SnakeSettings, generate_file, load_anchors, sample_segments, segment_lines, split_segments, write_output
+)
+from snaketools.timebase import format_time, seconds_to_ticks  # noqa: E402
+
+ARCHIVE = [
+    os.path.join(ROOT, "06. Value - HFF", "Value - HFF.ass"),
+    os.path.join(ROOT, "04. Value - Stage Flight 2024", "ValueFactory - Stage Flight.ass"),
+    os.path.join(ROOT, "10. Value - Furality Cameo", "Value - Loprov Cameo.ass"),
+]
+
+SCRIPTS = [
+    ("snake.py", os.path.join(ROOT, "10. Value - Furality Cameo", "snake.py")),
+    ("snakev2.py", os.path.join(ROOT, "10. Value - Furality Cameo", "snakev2.py")),
+]
+
+HEADER = """[Script Info]
+ScriptType: v4.00+
+PlayResX: 2560
+PlayResY: 1440
+
+[Events]
+Format: Layer, Start, End, Style, Name, MarginL, MarginR, MarginV, Effect, Text"""
+
+
+def write_synthetic(path, count, segment_length, seed=0):
+    """count anchors 0.1 s apart on a random walk, cut into start/end
+    segments of segment_length anchors (0 = one path)."""
+    rng = random.Random(seed)
+    x, y = 1280, 720
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(HEADER)
+        for i in range(count):
+            x = min(2560, max(0, x + rng.randint(-40, 40)))
+            y = min(1440, max(0, y + rng.randint(-40, 40)))
+            actor = ""
+            if segment_length:
+                if i % segment_length == 0:
+                    actor = "start"
+                elif i % segment_length == segment_length - 1 or i == count - 1:
+                    actor = "end"
+            start = i * 10
+            f.write(f"\nDialogue: 0,{format_time(start)},{format_time(start + 8)},MidForSymbols,{actor},"
+                    f"0,0,0,,{{\\pos({x},{y})}}*")
+
+
+def run_stages(path, output, settings):
+    """Run the core pipeline, yielding (stage, items) as each stage finishes."""
+    anchor_points, other_lines = load_anchors(path)
+    yield "parse", len(anchor_points)
+    segments_data = sample_segments(split_segments(anchor_points), settings)
+    yield "sample", sum(len(segment_data["points"]) for segment_data in segments_data)
+    snake_lines = []
+    for segment_data in segments_data:
+        snake_lines.extend(segment_lines(segment_data, settings))
+    yield "format", len(snake_lines)
+    write_output(output, other_lines, snake_lines)
+    yield "write", len(snake_lines)
+
+
+def run_generate(path, output, settings):
+    """The production path, parse to write in one streaming pass."""
+    yield "generate", generate_file(path, output, settings)
+
+
+def measure(run, path, output, settings):
+    """{stage: [items, seconds, peak bytes]} of the stages run yields. Timing
+    and memory come from separate passes, tracemalloc would distort the
+    timings."""
+    results = {}
+    last = time.perf_counter()
+    for stage, items in run(path, output, settings):
+        now = time.perf_counter()
+        results[stage] = [items, now - last, None]
+        last = now
+
+    tracemalloc.start()
+    try:
+        for stage, _ in run(path, output, settings):
+            results[stage][2] = tracemalloc.get_traced_memory()[1]
+            tracemalloc.reset_peak()
+    finally:
+        tracemalloc.stop()
+    return results
+
+
+def measure_core(path, output, settings):
+    """{stage: (items, seconds, peak bytes)} for the staged run and generate_file."""
+    results = measure(run_stages, path, output, settings)
+    results.update(measure(run_generate, path, output, settings))
+    return {stage: tuple(values) for stage, values in results.items()}
+
+
+def measure_script(script, path, output, step):
+    """(seconds, peak RSS bytes or None) of one script run, or the message it
+    printed if it wrote no output (the scripts exit 0 on their own errors)."""
+    argv = [sys.executable, script, path, output, "--step", str(step)]
+    if os.path.exists(output):
+        os.unlink(output)
+    start = time.perf_counter()
+    if not hasattr(os, "wait4"):
+        result = subprocess.run(argv, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                                text=True, check=True)
+        elapsed, peak, message = time.perf_counter() - start, None, result.stdout
+    else:
+        process = subprocess.Popen(argv, cwd=ROOT, stdout=subprocess.PIPE, stderr=subprocess.STDOUT, text=True)
+        message = process.stdout.read()
+        process.stdout.close()
+        _, status, usage = os.wait4(process.pid, 0)
+        elapsed = time.perf_counter() - start
+        process.returncode = os.waitstatus_to_exitcode(status)
+        if process.returncode:
+            raise subprocess.CalledProcessError(process.returncode, argv, message)
+        # ru_maxrss is in KiB on Linux, bytes on macOS
+        peak = usage.ru_maxrss * (1 if sys.platform == "darwin" else 1024)
+    if not os.path.exists(output):
+        return message.strip() or "no output written"
+    return elapsed, peak
+
+
+def format_row(label, stage, items, seconds, peak):
+    rate = f"{items / seconds:12,.0f}" if items is not None and seconds else f"{'':>12}"
+    count = f"{items:10,}" if items is not None else f"{'':>10}"
+    elapsed = f"{seconds * 1000:10.1f}" if seconds is not None else f"{'n/a':>10}"
+    memory = f"{peak / (1 << 20):9.1f}" if peak is not None else f"{'n/a':>9}"
+    return f"{label:34} {stage:10} {count} {elapsed} {rate} {memory}"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark the snake generator pipeline.")
+    parser.add_argument("--sizes", type=int, nargs="*", default=[1000, 10000, 100000, 1000000],
+                        help="Synthetic anchor counts (default: 10^3 to 10^6)")
+    parser.add_argument("--segment", type=int, default=500,
+                        help="Anchors per start/end segment in the synthetic sets (0 = one path)")
+    parser.add_argument("--step", type=float, default=0.1, help="Sampling step in seconds")
+    parser.add_argument("--interpolation", choices=["linear", "bezier"], default="bezier")
+    parser.add_argument("--no-archive", action="store_true", help="Skip the archive files")
+    parser.add_argument("--no-scripts", action="store_true", help="Skip the snake.py/snakev2.py runs")
+    parser.add_argument("--json", help="Also write the results to this file")
+    args = parser.parse_args()
+
+    settings = SnakeSettings(interpolation=args.interpolation, step=max(1, seconds_to_ticks(args.step)))
+    rows = []
+    if not args.no_scripts:
+        print(f"{', '.join(name for name, _ in SCRIPTS)}: end to end only, no per-stage rows")
+    print(f"{'input':34} {'stage':10} {'items':>10} {'ms':>10} {'items/s':>12} {'peak MiB':>9}")
+
+    with tempfile.TemporaryDirectory() as tmp:
+        inputs = [] if args.no_archive else [(os.path.basename(path), path) for path in ARCHIVE]
+        for size in args.sizes:
+            path = os.path.join(tmp, f"synthetic_{size}.ass")
+            write_synthetic(path, size, args.segment)
+            inputs.append((f"synthetic {size:,} anchors", path))
+
+        output = os.path.join(tmp, "output.ass")
+        for label, path in inputs:
+            for stage, (items, seconds, peak) in measure_core(path, output, settings).items():
+                rows.append({"input": label, "stage": stage, "items": items, "seconds": seconds, "peak_bytes": peak})
+                print(format_row(label, stage, items, seconds, peak))
+            if args.no_scripts:
+                continue
+            for name, script in SCRIPTS:
+                result = measure_script(script, path, output, args.step)
+                if isinstance(result, str):
+                    # Exited early, timing that would only measure the error path
+                    rows.append({"input": label, "stage": name, "items": None, "seconds": None,
+                                 "peak_bytes": None, "skipped": result})
+                    print(f"{format_row(label, name, None, None, None)}  ({result})")
+                    continue
+                seconds, peak = result
+                rows.append({"input": label, "stage": name, "items": None, "seconds": seconds, "peak_bytes": peak})
+                print(format_row(label, name, None, seconds, peak))
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump({"step": args.step, "interpolation": args.interpolation, "results": rows}, f, indent=2)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,88 @@
+"""Startup budget check for the snake tools.
+
+Runs each entry point with ``python -X importtime``, adds up the import cost
+on top of a bare interpreter and fails if a GUI-free path goes over budget or
+imports PyQt5 at all. Run from the repo root:
+
+    python benchmarks/startup.py [--budget-ms 50] [--runs 5]
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# (label, argv after the interpreter, checked against the budget)
+ENTRY_POINTS = [
+    ("snakev3.py --help", [os.path.join(ROOT, "12. Value - MovinOnMV", "snakev3.py"), "--help"], True),
+    ("Furality snakev3.py --help", [os.path.join(ROOT, "10. Value - Furality Cameo", "snakev3.py"), "--help"], True),
+    ("python -m snaketools --help", ["-m", "snaketools", "--help"], True),
+    ("import snaketools.cli", ["-c", "import snaketools.cli"], True),
+    ("import snaketools.core", ["-c", "import snaketools.core"], False),
+    ("snake.py --help", [os.path.join(ROOT, "10. Value - Furality Cameo", "snake.py"), "--help"], True),
+    ("snakev2.py --help", [os.path.join(ROOT, "10. Value - Furality Cameo", "snakev2.py"), "--help"], True),
+]
+
+
+def import_times(argv):
+    """{top-level module: cumulative microseconds} reported by -X importtime."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *argv],
+        cwd=ROOT, capture_output=True, text=True)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit() and not name.startswith("  "):
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def wall_time(argv, runs):
+    samples = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run([sys.executable, *argv], cwd=ROOT, capture_output=True)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure snake tool startup cost.")
+    parser.add_argument("--budget-ms", type=float, default=50.0,
+                        help="Max extra import time for GUI-free entry points (default: 50)")
+    parser.add_argument("--runs", type=int, default=5, help="Wall-clock runs per entry point")
+    args = parser.parse_args()
+
+    baseline = import_times(["-c", "pass"])
+    baseline_wall = wall_time(["-c", "pass"], args.runs)
+
+    print(f"{'entry point':32} {'imports ms':>10} {'wall ms':>9} {'+wall ms':>9}  notes")
+    failures = []
+    for label, argv, budgeted in ENTRY_POINTS:
+        times = import_times(argv)
+        extra = sum(us for name, us in times.items() if name not in baseline) / 1000
+        wall = wall_time(argv, args.runs)
+        notes = []
+        if any(name.split(".")[0] == "PyQt5" for name in times):
+            notes.append("imports PyQt5")
+        if budgeted:
+            if notes or extra > args.budget_ms:
+                failures.append(label)
+                notes.append("OVER BUDGET")
+        else:
+            notes.append("informational")
+        print(f"{label:32} {extra:10.1f} {wall * 1000:9.1f} {(wall - baseline_wall) * 1000:9.1f}  {', '.join(notes)}")
+
+    if failures:
+        print(f"\n{len(failures)} entry point(s) over the {args.budget_ms:g} ms budget: {', '.join(failures)}")
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1 @@
+# Shared engine for the snake subtitle scripts (snake.py, snakev2.py, snakev3.py).
@@ -0,0 +1,7 @@
+import sys
+
+from .cli import main
+
+# Guarded so worker processes started with "spawn" don't rerun the CLI
+if __name__ == "__main__":
+    sys.exit(main())
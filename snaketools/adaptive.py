@@ -0,0 +1,111 @@
+import numpy as np
+
+# Adaptive sampling. The fixed grid from sampler.py is treated as the "true"
+# curve, and only the samples needed to stay within `tolerance` pixels of it
+# are kept. Between two kept samples the position is assumed to move linearly
+# in time, which is exactly what a \move(x1,y1,x2,y2) event renders. That
+# only holds while a single dot is on screen at a time: sequential mode with a
+# point duration no longer than the sample spacing. In persistent mode, or
+# with an overlapping trail, the dropped samples are visible dots.
+
+
+def adaptive_indices(xs, ys, ts, tolerance=1.0):
+    """Indices of the samples to keep, always including the first and last.
+
+    Dropped samples are within `tolerance` px of the position linearly
+    interpolated (in time) between the kept samples around them.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    ts = np.asarray(ts, dtype=np.float64)
+    n = len(ts)
+    if n <= 2:
+        return np.arange(n)
+
+    keep = np.zeros(n, dtype=bool)
+    keep[0] = keep[-1] = True
+    stack = [(0, n - 1)]
+    while stack:
+        a, b = stack.pop()
+        if b - a < 2:
+            continue
+        inner = slice(a + 1, b)
+        span = ts[b] - ts[a]
+        frac = (ts[inner] - ts[a]) / span if span else np.zeros(b - a - 1)
+        err = np.hypot(
+            xs[a] + (xs[b] - xs[a]) * frac - xs[inner],
+            ys[a] + (ys[b] - ys[a]) * frac - ys[inner]
+        )
+        worst = int(np.argmax(err))
+        if err[worst] > tolerance:
+            mid = a + 1 + worst
+            keep[mid] = True
+            stack.append((a, mid))
+            stack.append((mid, b))
+    return np.flatnonzero(keep)
+
+
+def adaptive_problem(persistent, duration, spacing):
+    """Why adaptive sampling can't be used with these settings, None if it can.
+
+    spacing is the smallest gap between two samples (see sampler.sample_spacing).
+    """
+    if persistent:
+        return "adaptive sampling only works in sequential mode (A), in persistent mode every sample stays visible"
+    if duration > spacing:
+        return (f"adaptive sampling needs a point duration no longer than the sample spacing "
+                f"({spacing} cs), a longer duration draws an overlapping trail")
+    return None
+
+
+def snake_events(xs, ys, ts, duration, persistent_end=None, tolerance=None):
+    """Turn samples into (start, end, override_tag, sample_index) tuples.
+
+    Sequential mode (persistent_end is None) shows each sample for `duration`;
+    persistent mode keeps every sample up to `persistent_end`. With a
+    tolerance, sequential mode becomes a chain of \\move events between the
+    kept samples (the last one then holds for `duration`). Raises ValueError
+    for a tolerance where that would drop visible dots, see adaptive_problem.
+
+    The events are generated as they are consumed, only the sample arrays
+    are held, so they can go straight into an AssWriter.
+    """
+    ts = np.asarray(ts, dtype=np.int64)
+    if tolerance is not None and len(ts):
+        spacing = int(np.diff(ts).min()) if len(ts) > 1 else duration
+        problem = adaptive_problem(persistent_end is not None, duration, spacing)
+        if problem:
+            raise ValueError(problem)
+    xs = np.rint(xs).astype(np.int64)
+    ys = np.rint(ys).astype(np.int64)
+
+    if tolerance is None:
+        indices = np.arange(len(ts))
+    else:
+        indices = adaptive_indices(xs, ys, ts, tolerance)
+    # Checked above, the events themselves come out lazily
+    return _iter_events(xs, ys, ts, indices, duration, persistent_end, tolerance is not None)
+
+
+def _iter_events(xs, ys, ts, indices, duration, persistent_end, moving, chunk=4096):
+    last = len(indices) - 1
+    for lo in range(0, last + 1, chunk):
+        # Plain ints a chunk at a time, one extra sample for the \move target
+        selected = indices[lo:lo + chunk + 1]
+        x = xs[selected].tolist()
+        y = ys[selected].tolist()
+        t = ts[selected].tolist()
+        i = selected.tolist()
+        count = min(chunk, len(i))
+        if persistent_end is not None:
+            for k in range(count):
+                yield t[k], persistent_end, f"\\pos({x[k]},{y[k]})", i[k]
+        elif moving:
+            for k in range(min(count, last - lo)):
+                yield t[k], t[k + 1], f"\\move({x[k]},{y[k]},{x[k + 1]},{y[k + 1]})", i[k]
+            if lo + count > last:
+                k = count - 1
+                yield t[k], t[k] + duration, f"\\pos({x[k]},{y[k]})", i[k]
+        else:
+            for k in range(count):
+                yield t[k], t[k] + duration, f"\\pos({x[k]},{y[k]})", i[k]
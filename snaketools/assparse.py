@@ -0,0 +1,97 @@
+import re
+from typing import NamedTuple, Optional
+
+from .timebase import parse_time
+
+# Streaming reader for .ass files. Lines are read one at a time and every
+# Dialogue line is split and matched exactly once.
+
+DIALOGUE_PREFIX = "Dialogue: "
+_MISSING = object()
+POS_RE = re.compile(r'\\pos\((\d+),(\d+)\)')
+
+
+class DialogueEvent(NamedTuple):
+    layer: str
+    start_cs: int
+    end_cs: int
+    style: str
+    name: str
+    marginL: str
+    marginR: str
+    marginV: str
+    effect: str
+    text: str  # text with the \pos tags removed
+    x: Optional[int]
+    y: Optional[int]
+    line: str
+
+    @property
+    def has_pos(self):
+        return self.x is not None
+
+
+def parse_dialogue(line):
+    """Parse one stripped line, returns a DialogueEvent or None if it is not a Dialogue line."""
+    if not line.startswith(DIALOGUE_PREFIX):
+        return None
+    parts = line[len(DIALOGUE_PREFIX):].split(',', 9)
+    if len(parts) < 10:
+        return None
+
+    layer, start_str, end_str, style, name, marginL, marginR, marginV, effect, text = parts
+    match = POS_RE.search(text)
+    if match:
+        x, y = int(match.group(1)), int(match.group(2))
+        # Every \pos tag goes, the first one gives the position
+        text = POS_RE.sub('', text).strip()
+    else:
+        x = y = None
+
+    return DialogueEvent(
+        layer,
+        parse_time(start_str),
+        parse_time(end_str),
+        style, name, marginL, marginR, marginV, effect,
+        text, x, y, line
+    )
+
+
+def iter_lines(source, cache=None):
+    """Yield (line, event) for every line of a path or open file.
+
+    event is the parsed DialogueEvent or None for anything that isn't a
+    Dialogue line. Nothing is kept in memory between lines.
+
+    cache is an optional dict of line -> event from a previous read of the
+    same file. Unchanged lines are looked up instead of parsed, and once the
+    file has been read completely the dict holds exactly its current lines.
+    """
+    if isinstance(source, str):
+        with open(source, 'r', encoding='utf-8') as f:
+            yield from iter_lines(f, cache)
+        return
+    if cache is None:
+        for line in source:
+            line = line.strip()
+            yield line, parse_dialogue(line)
+        return
+    current = {}
+    for line in source:
+        line = line.strip()
+        event = current.get(line, _MISSING)
+        if event is _MISSING:
+            event = cache.get(line, _MISSING)
+            if event is _MISSING:
+                event = parse_dialogue(line)
+            current[line] = event
+        yield line, event
+    cache.clear()
+    cache.update(current)
+
+
+def iter_events(source, positioned_only=True):
+    """Yield only the Dialogue events of a file (by default only those with a \\pos tag)."""
+    for _, event in iter_lines(source):
+        if event is not None and (event.has_pos or not positioned_only):
+            yield event
@@ -0,0 +1,114 @@
+import os
+import tempfile
+from functools import lru_cache
+
+from .timebase import format_time
+
+# Streaming .ass output. Lines go straight into a buffered temp file next to
+# the target, which replaces the target only once everything was written, so
+# a failed export never leaves a truncated file behind and nothing has to be
+# joined in memory first.
+
+# (layer, style, name, marginL, marginR, marginV, effect) of a plain event
+DEFAULT_FIELDS = ('0', 'Default', '', '0', '0', '0', '')
+
+
+@lru_cache(maxsize=None)
+def event_prefix(fields):
+    """The constant parts of a Dialogue line around its start/end times.
+
+    fields is (layer, style, name, marginL, marginR, marginV, effect), returns
+    (head, tail) so a line is head + start + "," + end + tail + text.
+    """
+    layer, style, name, marginL, marginR, marginV, effect = fields
+    return f"Dialogue: {layer},", f",{style},{name},{marginL},{marginR},{marginV},{effect},"
+
+
+def format_event(start, end, text, fields=DEFAULT_FIELDS):
+    """One Dialogue line, start/end in centiseconds."""
+    head, tail = event_prefix(fields)
+    return f"{head}{format_time(start)},{format_time(end)}{tail}{text}"
+
+
+def _file_mode(path):
+    # Keep the permissions of the file being replaced, or what open() would
+    # have used for a new one (mkstemp always creates 0600)
+    try:
+        return os.stat(path).st_mode & 0o7777
+    except FileNotFoundError:
+        umask = os.umask(0)
+        os.umask(umask)
+        return 0o666 & ~umask
+
+
+class AssWriter:
+    """Context manager writing lines to path through a temp file.
+
+    Lines are separated by newlines without a trailing one, like the
+    generators always wrote them. The temp file is renamed over path when the
+    block exits normally and removed if it raises.
+    """
+
+    def __init__(self, path, buffering=1 << 16):
+        self.path = path
+        self.buffering = buffering
+        self.file = None
+        self.temp_path = None
+        self.separator = ""
+        self.count = 0
+
+    def __enter__(self):
+        directory = os.path.dirname(os.path.abspath(self.path))
+        fd, self.temp_path = tempfile.mkstemp(
+            dir=directory, prefix=f".{os.path.basename(self.path)}.", suffix=".tmp")
+        self.file = os.fdopen(fd, 'w', encoding='utf-8', buffering=self.buffering)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.file.close()
+        if exc_type is None:
+            os.chmod(self.temp_path, _file_mode(self.path))
+            os.replace(self.temp_path, self.path)
+        else:
+            os.unlink(self.temp_path)
+        return False
+
+    def write_line(self, line):
+        self.file.write(self.separator)
+        self.file.write(line)
+        self.separator = "\n"
+        self.count += 1
+
+    def write_lines(self, lines):
+        for line in lines:
+            self.write_line(line)
+
+    def tell(self):
+        """Byte offset in the output of the next line written."""
+        self.file.flush()
+        return self.file.buffer.tell()
+
+    def copy_range(self, source, start, end, count):
+        """Copy bytes [start, end) of a binary file holding count lines.
+
+        The range has to start with its separator, like every block written
+        after the first line, see incremental.py.
+        """
+        self.file.flush()
+        source.seek(start)
+        remaining = end - start
+        while remaining > 0:
+            chunk = source.read(min(remaining, 1 << 20))
+            if not chunk:
+                raise ValueError(f"{self.path}: source ended before byte {end}")
+            self.file.buffer.write(chunk)
+            remaining -= len(chunk)
+        if count:
+            self.separator = "\n"
+            self.count += count
+
+    def write_event(self, start, end, text, fields=DEFAULT_FIELDS):
+        head, tail = event_prefix(fields)
+        self.file.write(f"{self.separator}{head}{format_time(start)},{format_time(end)}{tail}{text}")
+        self.separator = "\n"
+        self.count += 1
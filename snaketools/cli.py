@@ -0,0 +1,97 @@
+import argparse
+import os
+import sys
+
+from .timebase import parse_fps, seconds_to_ticks
+
+# Headless batch front end for the snakev3 generator. Nothing here imports
+# PyQt5, so it runs on machines without a display. The core (and NumPy with
+# it) is only imported once there is actually something to generate, which
+# keeps --help and argument errors instant.
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog='python -m snaketools',
+        description='Generate snake subtitles for one or more ASS files without the UI.')
+    parser.add_argument('input_files', nargs='+', help='Input ASS subtitle file(s)')
+    parser.add_argument('-o', '--output', help='Output file (only with a single input)')
+    parser.add_argument('--output-dir', help='Write outputs here instead of next to the inputs')
+    parser.add_argument('--suffix', default='_snake',
+                        help='Appended to the input name when no --output is given (default: _snake)')
+    parser.add_argument('--interpolation', choices=['linear', 'bezier'], default='bezier',
+                        help='Interpolation method (linear or bezier)')
+    parser.add_argument('--step', type=float, default=0.1,
+                        help='Time step between points in seconds')
+    parser.add_argument('--fps', type=parse_fps, default=None,
+                        help='Sample once per video frame at this frame rate (e.g. 60 or 30000/1001), overrides --step')
+    parser.add_argument('--every', type=int, default=1,
+                        help='With --fps, only sample every Nth frame')
+    parser.add_argument('--mode', choices=['A', 'B'], default='A',
+                        help='Display mode: A=sequential, B=persistent')
+    parser.add_argument('--duration', type=float, default=0.1,
+                        help='Duration for each point in mode A')
+    parser.add_argument('--text_mode', choices=['uniform', 'per_point'], default='uniform',
+                        help='Text handling: uniform=first text of each segment, per_point=closest anchor')
+    parser.add_argument('--adaptive', type=float, default=None, metavar='PX',
+                        help='Only keep samples needed to stay within PX pixels of the curve, joined with \\move '
+                             '(mode A only, with a --duration no longer than the sample spacing)')
+    parser.add_argument('--incremental', action='store_true',
+                        help='Only regenerate the segments that changed since the last --incremental run '
+                             '(keeps a .manifest.json next to each output)')
+    parser.add_argument('-j', '--jobs', type=int, default=1,
+                        help='Sample and format independent path segments in N processes (0 = one per CPU)')
+    return parser
+
+
+def settings_from_args(args):
+    from .core import SnakeSettings
+    return SnakeSettings(
+        interpolation=args.interpolation,
+        step=max(1, seconds_to_ticks(args.step)),
+        fps=args.fps,
+        every=args.every,
+        persistent=args.mode == 'B',
+        duration=seconds_to_ticks(args.duration),
+        per_point_text=args.text_mode == 'per_point',
+        tolerance=args.adaptive
+    )
+
+
+def output_path(input_file, args):
+    if args.output:
+        return args.output
+    stem, ext = os.path.splitext(os.path.basename(input_file))
+    directory = args.output_dir or os.path.dirname(input_file)
+    return os.path.join(directory, f"{stem}{args.suffix}{ext or '.ass'}")
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.output and len(args.input_files) > 1:
+        parser.error("--output can only be used with a single input file")
+    if args.output_dir:
+        os.makedirs(args.output_dir, exist_ok=True)
+
+    from .core import generate_file
+    settings = settings_from_args(args)
+    if settings.tolerance is not None:
+        from .adaptive import adaptive_problem
+        from .sampler import sample_spacing
+        problem = adaptive_problem(settings.persistent, settings.duration,
+                                   sample_spacing(settings.step, settings.fps, settings.every))
+        if problem:
+            parser.error(f"--adaptive: {problem}")
+    workers = args.jobs if args.jobs > 0 else os.cpu_count()
+    failed = 0
+    for input_file in args.input_files:
+        output_file = output_path(input_file, args)
+        try:
+            count = generate_file(input_file, output_file, settings, workers, args.incremental)
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}", file=sys.stderr)
+            failed += 1
+            continue
+        print(f"{input_file} -> {output_file} ({count} snake events)")
+    return 1 if failed else 0
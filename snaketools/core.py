@@ -0,0 +1,294 @@
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import NamedTuple, Optional
+
+import numpy as np
+
+from .adaptive import snake_events
+from .assparse import iter_lines
+from .asswriter import AssWriter, format_event
+from .incremental import block_key, write_incremental
+from .sampler import nearest_indices, sample_segment
+
+# GUI-free part of snakev3.py: loading anchors, splitting them into
+# start/end segments, sampling and formatting the snake events. The Qt window
+# and the headless CLI (cli.py) both drive these functions.
+
+
+class AnchorPoint:
+    __slots__ = ('x', 'y', 'time', 'text', 'index', 'style', 'actor', 'original_x', 'original_y')
+
+    def __init__(self, x, y, time, text, index, style, actor):
+        self.x = x
+        self.y = y
+        self.time = time
+        self.text = text
+        self.index = index
+        self.style = style
+        self.actor = actor
+        self.original_x = x
+        self.original_y = y
+
+
+class SnakeSettings(NamedTuple):
+    interpolation: str = 'bezier'      # 'linear' or 'bezier'
+    step: int = 10                     # centiseconds
+    fps: Optional[object] = None       # frame-locked sampling, overrides step
+    every: int = 1                     # with fps, every Nth frame
+    persistent: bool = False           # False: each point disappears after duration
+    duration: int = 10                 # centiseconds, sequential mode only
+    per_point_text: bool = False       # text/style of the closest anchor instead of the first
+    tolerance: Optional[float] = None  # adaptive sampling in px
+
+
+def load_anchors(path, parse_cache=None):
+    """Read an .ass file, returns (anchor_points, other_lines).
+
+    Every Dialogue line with a \\pos tag becomes an AnchorPoint, everything
+    else is kept verbatim for the output. parse_cache is passed on to
+    iter_lines, for reading the same file again after an edit.
+    """
+    anchor_points = []
+    other_lines = []
+    for line, event in iter_lines(path, parse_cache):
+        if event is not None and event.has_pos:
+            # Straight to AnchorPoint, the UI moves anchors around one by one
+            anchor_points.append(AnchorPoint(
+                event.x, event.y, event.start_cs, event.text, len(anchor_points), event.style, event.name))
+            continue
+        other_lines.append(line)
+    return anchor_points, other_lines
+
+
+def split_segments(anchor_points):
+    """Group anchors into independent paths using the start/end/noAnim actors."""
+    # Sort anchor points by time
+    sorted_anchors = sorted(
+        [p for p in anchor_points if p.actor != "noAnim"], key=lambda p: p.time)
+
+    # Identify path segments based on "start" and "end" actors
+    path_segments = []
+    current_segment = []
+    in_segment = False
+
+    # Default to a single path if no start/end markers
+    if not any(p.actor in ["start", "end"] for p in sorted_anchors):
+        path_segments.append(sorted_anchors)
+    else:
+        for point in sorted_anchors:
+            if point.actor == "start":
+                if in_segment: # End previous segment if a new one starts
+                    path_segments.append(current_segment)
+                current_segment = [point]
+                in_segment = True
+            elif point.actor == "end" and in_segment:
+                current_segment.append(point)
+                path_segments.append(current_segment)
+                current_segment = []
+                in_segment = False
+            elif in_segment:
+                current_segment.append(point)
+    return path_segments
+
+
+class SegmentCache:
+    """LRU cache of sampled segments.
+
+    Keyed by the anchors' (time, x, y) and the settings that affect sampling,
+    so only segments whose anchors or sampling parameters changed are sampled
+    again. The size is bounded by the total number of samples held, not the
+    number of segments, since one long segment at a fine step can outweigh
+    hundreds of short ones. Shared between the GUI thread and the background
+    path job, hence the lock.
+    """
+
+    def __init__(self, max_samples=2_000_000):
+        self.max_samples = max_samples
+        self.samples = 0
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+
+    @staticmethod
+    def key(segment, settings):
+        return (
+            tuple((p.time, p.x, p.y) for p in segment),
+            settings.interpolation, settings.step, settings.fps, settings.every
+        )
+
+    def get(self, key):
+        with self.lock:
+            points = self.entries.get(key)
+            if points is not None:
+                self.entries.move_to_end(key)
+            return points
+
+    def put(self, key, points):
+        if len(points) > self.max_samples:
+            return  # would push out everything else
+        # Entries are shared by everyone who gets them, keep them read-only
+        points.flags.writeable = False
+        with self.lock:
+            old = self.entries.pop(key, None)
+            if old is not None:
+                self.samples -= len(old)
+            self.entries[key] = points
+            self.samples += len(points)
+            while self.samples > self.max_samples:
+                _, evicted = self.entries.popitem(last=False)
+                self.samples -= len(evicted)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+            self.samples = 0
+
+
+def sample_points(segment, settings):
+    """Samples along one segment of anchors, an (n, 3) float array of x, y, t rows."""
+    xs, ys, ts = sample_segment(
+        [p.time for p in segment],
+        [p.x for p in segment],
+        [p.y for p in segment],
+        settings.step,
+        settings.interpolation,
+        fps=settings.fps,
+        every=settings.every
+    )
+    return np.column_stack((xs, ys, ts.astype(np.float64)))
+
+
+def sample_segments(path_segments, settings, cache=None):
+    """Sample every segment, returns [{"points": sample_points(...), "anchors": segment}, ...].
+
+    With a SegmentCache, segments sampled before with the same anchors and
+    settings are reused instead of sampled again.
+    """
+    segments_data = []
+    for segment in path_segments:
+        if len(segment) < 2:
+            continue
+        if cache is None:
+            points = sample_points(segment, settings)
+        else:
+            key = SegmentCache.key(segment, settings)
+            points = cache.get(key)
+            if points is None:
+                points = sample_points(segment, settings)
+                cache.put(key, points)
+        segments_data.append({
+            "points": points,
+            "anchors": segment
+        })
+    return segments_data
+
+
+def segment_lines(segment_data, settings):
+    """Formatted Dialogue lines for one sampled segment, generated one by one."""
+    segment_anchors = segment_data["anchors"]
+    segment_points = segment_data["points"]
+    if not segment_anchors or not len(segment_points):
+        return
+
+    uniform_text = segment_anchors[0].text
+    last_time = segment_anchors[-1].time + 10  # Small offset (centiseconds)
+
+    xs, ys, times = segment_points.T
+    placed = snake_events(
+        xs, ys, times, settings.duration,
+        persistent_end=last_time if settings.persistent else None,
+        tolerance=settings.tolerance
+    )
+
+    if settings.per_point_text:
+        # Closest anchor of every sample in one binary search pass
+        closest = nearest_indices([p.time for p in segment_anchors], times)
+
+    for start, end, tag, sample in placed:
+        style = "style"
+        # Determine text
+        if not settings.per_point_text:
+            text_content = uniform_text
+        else:
+            # Closest anchor point in the current segment
+            closest_idx = closest[sample]
+            style = segment_anchors[closest_idx].style
+            text_content = segment_anchors[closest_idx].text
+
+        # Create event
+        yield format_event(start, end, f"{{{tag}}}{text_content}", ('0', style, '', '0', '0', '0', ''))
+
+
+def segment_key(segment, settings):
+    """Key of everything a segment's Dialogue lines depend on, for incremental export."""
+    return block_key([(p.time, p.x, p.y, p.text, p.style) for p in segment], tuple(settings))
+
+
+def iter_segment_lines(segment, settings, cache=None):
+    """Sample one segment and generate its Dialogue lines."""
+    for segment_data in sample_segments([segment], settings, cache):
+        yield from segment_lines(segment_data, settings)
+
+
+def render_segment(segment, settings, cache=None):
+    """Sample and format one segment. Segments share no state, so this is
+    what gets shipped to the worker processes, the lines travel back as a list."""
+    return list(iter_segment_lines(segment, settings, cache))
+
+
+def iter_rendered_segments(path_segments, settings, workers=1):
+    """Dialogue lines of each segment in turn, optionally rendered in a process pool.
+
+    The results come back in segment order, which is time order since the
+    segments are cut from the time-sorted anchors. Only one segment's lines
+    are handed out at a time, so they can be written as they arrive. Without
+    a pool they are generated while being written.
+    """
+    if workers and workers > 1 and len(path_segments) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            chunksize = max(1, len(path_segments) // (workers * 4))
+            yield from pool.map(render_segment, path_segments, repeat(settings), chunksize=chunksize)
+    else:
+        for segment in path_segments:
+            yield iter_segment_lines(segment, settings)
+
+
+def render_segments(path_segments, settings, workers=1):
+    """Dialogue lines for all segments as one list."""
+    snake_lines = []
+    for lines in iter_rendered_segments(path_segments, settings, workers):
+        snake_lines.extend(lines)
+    return snake_lines
+
+
+def write_output(path, other_lines, snake_lines):
+    """Write the kept lines followed by the snake lines (any iterables), atomically."""
+    with AssWriter(path) as out:
+        out.write_lines(other_lines)
+        out.write_lines(snake_lines)
+        return out.count
+
+
+def generate_file(input_file, output_file, settings=SnakeSettings(), workers=1, incremental=False):
+    """Whole pipeline for one file, returns the number of snake events written.
+
+    workers > 1 samples and formats the segments in that many processes.
+    incremental only formats the segments that changed since the last
+    incremental export to output_file and copies the rest from it.
+    """
+    anchor_points, other_lines = load_anchors(input_file)
+    if len(anchor_points) < 2:
+        raise ValueError(f"{input_file}: Need at least 2 anchor points")
+    path_segments = split_segments(anchor_points)
+    if incremental:
+        events, _ = write_incremental(
+            output_file, other_lines,
+            [(segment_key(segment, settings), segment) for segment in path_segments],
+            lambda changed: iter_rendered_segments(changed, settings, workers))
+        return events
+    with AssWriter(output_file) as out:
+        out.write_lines(other_lines)
+        for lines in iter_rendered_segments(path_segments, settings, workers):
+            out.write_lines(lines)
+        return out.count - len(other_lines)
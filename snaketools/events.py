@@ -0,0 +1,109 @@
+from array import array
+
+import numpy as np
+
+# Column store for parsed Dialogue events. Instead of one dict/object per
+# event, every field lives in its own compact array and repeated strings
+# (style, actor name, text, margins/effect) are interned to small ids.
+
+
+def _view(column):
+    return np.frombuffer(column, dtype=np.int64 if column.itemsize == 8 else np.int32)
+
+
+class StringTable:
+    __slots__ = ('values', '_ids')
+
+    def __init__(self):
+        self.values = []
+        self._ids = {}
+
+    def intern(self, value):
+        idx = self._ids.get(value)
+        if idx is None:
+            idx = len(self.values)
+            self._ids[value] = idx
+            self.values.append(value)
+        return idx
+
+    def __getitem__(self, idx):
+        return self.values[idx]
+
+    def __len__(self):
+        return len(self.values)
+
+
+class EventStore:
+    __slots__ = (
+        'start_cs', 'end_cs', 'x', 'y', 'layer',
+        'style_id', 'name_id', 'text_id', 'extra_id',
+        'styles', 'names', 'texts', 'extras'
+    )
+
+    def __init__(self):
+        self.start_cs = array('q')
+        self.end_cs = array('q')
+        self.x = array('i')
+        self.y = array('i')
+        self.layer = array('i')
+        self.style_id = array('i')
+        self.name_id = array('i')
+        self.text_id = array('i')
+        self.extra_id = array('i')  # (marginL, marginR, marginV, effect)
+        self.styles = StringTable()
+        self.names = StringTable()
+        self.texts = StringTable()
+        self.extras = StringTable()
+
+    @classmethod
+    def from_events(cls, events):
+        store = cls()
+        for event in events:
+            store.append(event)
+        return store
+
+    def append(self, event):
+        self.start_cs.append(event.start_cs)
+        self.end_cs.append(event.end_cs)
+        self.x.append(event.x if event.x is not None else 0)
+        self.y.append(event.y if event.y is not None else 0)
+        self.layer.append(int(event.layer))
+        self.style_id.append(self.styles.intern(event.style))
+        self.name_id.append(self.names.intern(event.name))
+        self.text_id.append(self.texts.intern(event.text))
+        self.extra_id.append(self.extras.intern((event.marginL, event.marginR, event.marginV, event.effect)))
+
+    def __len__(self):
+        return len(self.start_cs)
+
+    def _columns(self):
+        return (self.start_cs, self.end_cs, self.x, self.y, self.layer,
+                self.style_id, self.name_id, self.text_id, self.extra_id)
+
+    def sort_by_start(self):
+        # Stable, so events sharing a start time keep their file order
+        order = np.argsort(self.starts(), kind='stable')
+        for column in self._columns():
+            view = _view(column)
+            view[:] = view[order]
+
+    def column(self, name):
+        """NumPy view of one integer column (don't append while holding it)."""
+        return _view(getattr(self, name))
+
+    def starts(self):
+        return self.column('start_cs')
+
+    def style(self, i):
+        return self.styles[self.style_id[i]]
+
+    def name(self, i):
+        return self.names[self.name_id[i]]
+
+    def text(self, i):
+        return self.texts[self.text_id[i]]
+
+    def fields(self, i):
+        """(layer, style, name, marginL, marginR, marginV, effect) of event i, as strings."""
+        marginL, marginR, marginV, effect = self.extras[self.extra_id[i]]
+        return (str(self.layer[i]), self.style(i), self.name(i), marginL, marginR, marginV, effect)
@@ -0,0 +1,88 @@
+import hashlib
+import json
+import os
+from contextlib import nullcontext
+
+from .asswriter import AssWriter
+
+# Incremental export. A manifest next to the output records, for every block
+# of the file (the kept input lines first, then one block per segment), the
+# byte range it occupies and a key of what it was generated from. The next
+# export copies the bytes of every block whose key is unchanged and only
+# formats the blocks that changed.
+
+MANIFEST_VERSION = 1
+
+
+def manifest_path(output_file):
+    return output_file + ".manifest.json"
+
+
+def block_key(*parts):
+    return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
+
+def load_manifest(output_file):
+    """The manifest of the last incremental export, or None if output_file
+    has been written or touched since (it is then regenerated in full)."""
+    try:
+        with open(manifest_path(output_file), encoding='utf-8') as f:
+            manifest = json.load(f)
+        stat = os.stat(output_file)
+    except (OSError, ValueError):
+        return None
+    if (manifest.get("version") != MANIFEST_VERSION
+            or manifest.get("size") != stat.st_size
+            or manifest.get("mtime_ns") != stat.st_mtime_ns):
+        return None
+    return manifest
+
+
+def write_incremental(output_file, other_lines, segments, render):
+    """Write other_lines and the segments, reusing unchanged blocks of the last export.
+
+    segments is [(key, segment), ...] where key covers everything the
+    segment's lines depend on. render(changed) gets the segments that need
+    formatting and yields an iterable of lines for each, in the same order.
+    Returns (event_count, reused_segments).
+    """
+    manifest = load_manifest(output_file)
+    # Copied blocks start with their separator, which only holds after a
+    # non-empty first block
+    old_blocks = {}
+    if manifest is not None and other_lines:
+        old_blocks = {block["key"]: block for block in manifest["blocks"]}
+
+    header_key = block_key(other_lines)
+    changed = [segment for key, segment in segments if key not in old_blocks]
+    rendered = iter(render(changed))
+
+    blocks = []
+    events = reused = 0
+    with AssWriter(output_file) as out:
+        with open(output_file, 'rb') if old_blocks else nullcontext() as source:
+            for i, (key, item) in enumerate([(header_key, None)] + list(segments)):
+                start = out.tell()
+                old = old_blocks.get(key)
+                if old is not None:
+                    out.copy_range(source, old["start"], old["end"], old["count"])
+                    count = old["count"]
+                    reused += i > 0
+                else:
+                    lines = other_lines if i == 0 else next(rendered)
+                    before = out.count
+                    out.write_lines(lines)
+                    count = out.count - before
+                blocks.append({"key": key, "start": start, "end": out.tell(), "count": count})
+                if i > 0:
+                    events += count
+
+    stat = os.stat(output_file)
+    with AssWriter(manifest_path(output_file)) as out:
+        out.write_line(json.dumps({
+            "version": MANIFEST_VERSION,
+            "size": stat.st_size,
+            "mtime_ns": stat.st_mtime_ns,
+            "blocks": blocks
+        }))
+    return events, reused
@@ -0,0 +1,132 @@
+import numpy as np
+
+from .timebase import parse_fps
+
+# Vectorised path sampling. Everything here works on whole arrays at once:
+# anchor times/coordinates go in, every (x, y, t) sample of a segment comes out.
+# Times are integer centiseconds (see timebase.py), so the grid is exact.
+
+
+def sample_times(start, end, step):
+    # start, start+step, ... up to and including end when it is on the grid
+    if end < start or step <= 0:
+        return np.empty(0, dtype=np.int64)
+    return np.arange(start, end + 1, step, dtype=np.int64)
+
+
+def frame_times(start, end, fps, every=1):
+    """Centisecond start times of every `every`-th video frame in [start, end].
+
+    Each time is the first centisecond at or after the frame's timestamp, so
+    the event becomes visible on exactly that frame. Frames that round to the
+    same centisecond (fps > 100) are emitted once.
+    """
+    fps = parse_fps(fps)
+    num, den = fps.numerator, fps.denominator
+    # frame k is shown at k * den / num seconds = k * 100 * den / num centiseconds
+    first = -((-start * num) // (100 * den))  # ceil
+    last = (end * num) // (100 * den)
+    if last < first:
+        return np.empty(0, dtype=np.int64)
+    frames = np.arange(first, last + 1, max(1, int(every)), dtype=np.int64)
+    times = -((-frames * 100 * den) // num)
+    return np.unique(times)
+
+
+def sample_spacing(step, fps=None, every=1):
+    """Smallest gap in centiseconds between two samples of sample_segment."""
+    if fps:
+        return max(1, int(100 * max(1, int(every)) / parse_fps(fps)))
+    return step
+
+
+def segment_indices(anchor_t, times):
+    # Index i of the first anchor interval [anchor_t[i], anchor_t[i+1]] holding
+    # each sample. One binary search per sample over the sorted anchor times,
+    # so this is O(samples * log(anchors)) instead of a scan per sample.
+    idx = np.searchsorted(anchor_t, times, side='left') - 1
+    return np.clip(idx, 0, len(anchor_t) - 2)
+
+
+def anchor_indices(anchor_t, times):
+    # Index of the last anchor starting at or before each sample (-1 before the first)
+    return np.searchsorted(np.asarray(anchor_t, dtype=np.int64), times, side='right') - 1
+
+
+def nearest_indices(anchor_t, times):
+    # Index of the anchor closest in time to each sample. Ties go to the
+    # earlier anchor, and to the first of several anchors sharing a time,
+    # same as scanning the anchors in order for the smallest difference
+    anchor_t = np.asarray(anchor_t, dtype=np.int64)
+    times = np.asarray(times, dtype=np.int64)
+    right = np.searchsorted(anchor_t, times, side='left')
+    left = np.searchsorted(anchor_t, anchor_t[np.maximum(right - 1, 0)], side='left')
+    right = np.minimum(right, len(anchor_t) - 1)
+    take_left = np.abs(times - anchor_t[left]) <= np.abs(anchor_t[right] - times)
+    return np.where(take_left, left, right)
+
+
+def _local_fraction(anchor_t, idx, times):
+    t0 = anchor_t[idx]
+    t1 = anchor_t[idx + 1]
+    span = (t1 - t0).astype(np.float64)
+    frac = np.zeros(len(times), dtype=np.float64)
+    np.divide(times - t0, span, out=frac, where=span != 0)
+    return frac
+
+
+def interpolate_linear(anchor_t, anchor_x, anchor_y, times):
+    idx = segment_indices(anchor_t, times)
+    frac = _local_fraction(anchor_t, idx, times)
+    xs = anchor_x[idx] + (anchor_x[idx + 1] - anchor_x[idx]) * frac
+    ys = anchor_y[idx] + (anchor_y[idx + 1] - anchor_y[idx]) * frac
+    return xs, ys
+
+
+def _catmull_rom(p0, p1, p2, p3, t):
+    t2 = t * t
+    t3 = t2 * t
+    return 0.5 * (2 * p1 + t * (-p0 + p2) + t2 * (2 * p0 - 5 * p1 + 4 * p2 - p3) + t3 * (-p0 + 3 * p1 - 3 * p2 + p3))
+
+
+def interpolate_bezier(anchor_t, anchor_x, anchor_y, times):
+    # Catmull-Rom through the anchors (the UI calls it "Bézier")
+    n = len(anchor_t)
+    idx = segment_indices(anchor_t, times)
+    frac = _local_fraction(anchor_t, idx, times)
+    i0 = np.maximum(idx - 1, 0)
+    i3 = np.minimum(idx + 2, n - 1)
+    xs = _catmull_rom(anchor_x[i0], anchor_x[idx], anchor_x[idx + 1], anchor_x[i3], frac)
+    ys = _catmull_rom(anchor_y[i0], anchor_y[idx], anchor_y[idx + 1], anchor_y[i3], frac)
+    return xs, ys
+
+
+def sample_segment(anchor_t, anchor_x, anchor_y, step, interpolation='linear', fps=None, every=1):
+    """Sample one path segment, returns (xs, ys, ts) arrays.
+
+    anchor_t/step are centiseconds, ts comes back as int64 centiseconds and
+    xs/ys as floats. With fps set, step is ignored and there is one sample
+    per `every`-th video frame instead. Anchors must already be sorted by time
+    and there must be at least two.
+    """
+    anchor_t = np.asarray(anchor_t, dtype=np.int64)
+    if len(anchor_t) < 2:
+        raise ValueError("Need at least 2 anchor points")
+
+    if fps:
+        times = frame_times(anchor_t[0], anchor_t[-1], fps, every)
+    else:
+        times = sample_times(anchor_t[0], anchor_t[-1], step)
+    xs, ys = sample_at(anchor_t, anchor_x, anchor_y, times, interpolation)
+    return xs, ys, times
+
+
+def sample_at(anchor_t, anchor_x, anchor_y, times, interpolation='linear'):
+    """Positions of the path at the given (sorted, centisecond) times."""
+    anchor_t = np.asarray(anchor_t, dtype=np.int64)
+    anchor_x = np.asarray(anchor_x, dtype=np.float64)
+    anchor_y = np.asarray(anchor_y, dtype=np.float64)
+    times = np.asarray(times, dtype=np.int64)
+    if interpolation == 'bezier':
+        return interpolate_bezier(anchor_t, anchor_x, anchor_y, times)
+    return interpolate_linear(anchor_t, anchor_x, anchor_y, times)
@@ -0,0 +1,53 @@
+import numpy as np
+
+# Douglas-Peucker for the preview. Instead of simplifying once per zoom level,
+# one pass records how important every point is; any level of detail is then
+# just `significance > tolerance`.
+
+
+def significance(xs, ys, min_tolerance=0.0):
+    """Douglas-Peucker significance of every point of a polyline.
+
+    A point is part of the simplification at tolerance eps exactly when its
+    significance is > eps. Endpoints are always kept (inf). Ranges whose error
+    is already <= min_tolerance are not split further, their inner points get 0.
+    """
+    xs = np.asarray(xs, dtype=np.float64)
+    ys = np.asarray(ys, dtype=np.float64)
+    n = len(xs)
+    sig = np.zeros(n, dtype=np.float64)
+    if n == 0:
+        return sig
+    sig[0] = sig[-1] = np.inf
+
+    # (first, last, significance of the split that created this range)
+    stack = [(0, n - 1, np.inf)]
+    while stack:
+        a, b, parent = stack.pop()
+        if b - a < 2:
+            continue
+        px = xs[a + 1:b] - xs[a]
+        py = ys[a + 1:b] - ys[a]
+        dx = xs[b] - xs[a]
+        dy = ys[b] - ys[a]
+        length = np.hypot(dx, dy)
+        if length > 0:
+            dist = np.abs(px * dy - py * dx) / length
+        else:
+            dist = np.hypot(px, py)
+        worst = int(np.argmax(dist))
+        err = dist[worst]
+        if err <= min_tolerance:
+            continue
+        # Clamp to the parent so coarser levels are always subsets of finer ones
+        err = min(err, parent)
+        mid = a + 1 + worst
+        sig[mid] = err
+        stack.append((a, mid, err))
+        stack.append((mid, b, err))
+    return sig
+
+
+def lod_levels(base=0.25, count=9):
+    """Tolerances of the level-of-detail pyramid: base, 2*base, 4*base ..."""
+    return [base * 2 ** i for i in range(count)]
@@ -0,0 +1,58 @@
+from fractions import Fraction
+
+# Integer timebase for the snake pipeline. All times are centiseconds (the
+# resolution of .ass timestamps), so sample grids are exact and formatting
+# is pure integer arithmetic.
+
+TICKS_PER_SECOND = 100
+
+_TWO_DIGITS = [f"{i:02d}" for i in range(100)]
+
+
+def seconds_to_ticks(seconds):
+    return round(seconds * TICKS_PER_SECOND)
+
+
+def ticks_to_seconds(ticks):
+    return ticks / TICKS_PER_SECOND
+
+
+def parse_time(time_str):
+    """'H:MM:SS.cc' -> centiseconds."""
+    # Fast path for the layout every .ass writer uses
+    if len(time_str) >= 10 and time_str[-3] == '.' and time_str[-6] == ':' and time_str[-9] == ':':
+        return (int(time_str[:-9]) * 360000 + int(time_str[-8:-6]) * 6000
+                + int(time_str[-5:-3]) * 100 + int(time_str[-2:]))
+    return _parse_time_loose(time_str)
+
+
+def _parse_time_loose(time_str):
+    # Hand-written timestamps: M:SS.c, SS, 1 or 3+ fraction digits ...
+    hours = minutes = 0
+    parts = time_str.split(':')
+    if len(parts) == 3:
+        hours, minutes = int(parts[0]), int(parts[1])
+    elif len(parts) == 2:
+        minutes = int(parts[0])
+    sec, _, frac = parts[-1].partition('.')
+    centis = int((frac + '00')[:2]) if frac else 0
+    return ((hours * 60 + minutes) * 60 + int(sec)) * 100 + centis
+
+
+def format_time(ticks):
+    """centiseconds -> 'H:MM:SS.cc'."""
+    if ticks < 0:
+        ticks = 0
+    seconds, centis = divmod(ticks, 100)
+    minutes, seconds = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{_TWO_DIGITS[minutes]}:{_TWO_DIGITS[seconds]}.{_TWO_DIGITS[centis]}"
+
+
+def parse_fps(value):
+    """'60', '59.94' or '30000/1001' -> Fraction, so NTSC rates stay exact."""
+    fps = Fraction(str(value))
+    if fps <= 0:
+        raise ValueError(f"fps must be positive, got {value}")
+    return fps
+
@@ -0,0 +1,805 @@
+import os
+import sys
+
+import numpy as np
+from PyQt5.QtWidgets import (
+    QApplication, QMainWindow, QGraphicsView, QGraphicsScene, QVBoxLayout, QWidget,
+    QLabel, QDoubleSpinBox, QSpinBox, QComboBox, QPushButton, QGroupBox, QHBoxLayout, QMessageBox,
+    QStatusBar, QToolBar, QAction, QCheckBox
+)
+from PyQt5.QtCore import (
+    Qt, QTimer, QElapsedTimer, QRectF, QObject, QRunnable, QThreadPool, QFileSystemWatcher, pyqtSignal
+)
+from PyQt5.QtGui import QPainterPath, QPen, QColor, QBrush, QKeySequence, QWheelEvent, QPainter, QPolygonF
+
+from .core import (
+    SegmentCache, SnakeSettings, load_anchors, split_segments, sample_segments, segment_key, segment_lines,
+    write_output
+)
+from .incremental import write_incremental
+from .simplify import lod_levels, significance
+from .timebase import format_time, seconds_to_ticks
+
+# Qt window of snakev3.py. Importing this module pulls in PyQt5, so only do
+# it once a window is actually going to be shown.
+
+# Path level-of-detail tolerances in scene units (0.25, 0.5, 1 ... 64)
+LOD_LEVELS = lod_levels()
+
+# Quiet time after the last parameter change before the path is recomputed (ms)
+RECOMPUTE_DELAY = 150
+
+# Wait this long after the input file changed before reloading it (ms), saves
+# often arrive as several writes or as a delete followed by a rename
+WATCH_DELAY = 200
+
+# Preview playback rates offered in the UI
+PLAYBACK_SPEEDS = (0.25, 0.5, 1.0, 2.0, 4.0)
+
+
+def polyline_path(xs, ys):
+    """QPainterPath through the points, filled straight from the arrays."""
+    path = QPainterPath()
+    if len(xs):
+        polygon = QPolygonF(len(xs))
+        buffer = polygon.data()
+        buffer.setsize(len(xs) * 2 * np.dtype(np.float64).itemsize)  # QPointF is two qreals (doubles)
+        coords = np.frombuffer(buffer, dtype=np.float64).reshape(-1, 2)
+        coords[:, 0] = xs
+        coords[:, 1] = ys
+        path.addPolygon(polygon)
+    return path
+
+
+def path_columns(segments_data):
+    """{"xs", "ys", "times"} of the whole path, enough for the playback clock."""
+    points = np.concatenate([segment_data["points"] for segment_data in segments_data] or [np.empty((0, 3))])
+    return {"xs": points[:, 0], "ys": points[:, 1], "times": points[:, 2].astype(np.int64)}
+
+
+def path_preview(segments_data):
+    """Everything the preview shows of a new path, ready to be swapped in.
+
+    path_columns plus "paths", the polyline of every level of detail (-1 =
+    every sample). The Douglas-Peucker pass and building the polylines are
+    the expensive part of a new path, so only PathJob runs this, never the
+    GUI thread.
+    """
+    preview = path_columns(segments_data)
+    xs, ys = preview["xs"], preview["ys"]
+    sig = significance(xs, ys, LOD_LEVELS[0])
+    preview["paths"] = {-1: polyline_path(xs, ys)}
+    for level, tolerance in enumerate(LOD_LEVELS):
+        keep = sig > tolerance
+        preview["paths"][level] = polyline_path(xs[keep], ys[keep])
+    return preview
+
+
+class PathJobSignals(QObject):
+    done = pyqtSignal(int, object, object)  # generation, segments_data, path_preview
+
+
+class PathJob(QRunnable):
+    """Samples the segments and prepares the preview path off the GUI thread.
+
+    Every job carries the generation it was started for. is_current is checked
+    between segments so a job that has been superseded stops early, and the
+    window drops any result that arrives for an old generation. With
+    segments_data (already sampled on the GUI thread) only the preview is
+    left to build.
+    """
+
+    def __init__(self, generation, path_segments, settings, is_current, cache=None, segments_data=None):
+        super().__init__()
+        self.generation = generation
+        self.path_segments = path_segments
+        self.settings = settings
+        self.is_current = is_current
+        self.cache = cache
+        self.segments_data = segments_data
+        self.signals = PathJobSignals()
+
+    def run(self):
+        segments_data = self.segments_data
+        if segments_data is None:
+            segments_data = []
+            for segment in self.path_segments:
+                if not self.is_current(self.generation):
+                    return
+                segments_data.extend(sample_segments([segment], self.settings, self.cache))
+        if not self.is_current(self.generation):
+            return
+        self.signals.done.emit(self.generation, segments_data, path_preview(segments_data))
+
+
+class ZoomableGraphicsView(QGraphicsView):
+    def __init__(self, width, height, parent=None):
+        super().__init__(parent)
+        self.scene = QGraphicsScene()
+        self.setScene(self.scene)
+        self.setRenderHint(QPainter.Antialiasing)
+        self.setRenderHint(QPainter.SmoothPixmapTransform)
+        self.setDragMode(QGraphicsView.ScrollHandDrag)
+        self.setTransformationAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setResizeAnchor(QGraphicsView.AnchorUnderMouse)
+        self.setSceneRect(0, 0, width, height)
+        self.width = width
+        self.height = height
+        self.anchor_points = []
+        self.animation_index = 0
+        self.animation_timer = QTimer(self)
+        self.animation_timer.setTimerType(Qt.PreciseTimer)
+        self.animation_timer.timeout.connect(self.animate_snake)
+        self.animation_speed = 16  # ms per redraw, the position comes from the clock
+        self.animation_running = False
+        # Playback clock: subtitle time = animation_start + elapsed * playback_rate
+        self.animation_clock = QElapsedTimer()
+        self.animation_start = 0  # centiseconds
+        self.playback_rate = 1.0
+        self.zoom_level = 1.0
+        
+        # Retained scene: items are created once and only touched when their
+        # data changes, so an animation tick just moves the marker
+        self.grid_items = []
+        self.grid_size = None
+        self.anchor_items = []
+        self.anchor_state = []
+        self.anchors_dirty = False
+        self.path_dirty = False
+        
+        self.path_item = self.scene.addPath(QPainterPath(), QPen(QColor(0, 200, 255), 2))
+        # Above the grid (0), which is added later, below the anchor lines (1)
+        self.path_item.setZValue(0.5)
+        # Path columns and one polyline per level of detail, from path_preview
+        self.path_xs = self.path_ys = np.empty(0)
+        self.path_times = np.empty(0, dtype=np.int64)
+        self.lod_paths = {}
+        self.lod_level = None
+        
+        self.anim_marker = self.scene.addEllipse(
+            -8, -8, 16, 16, QPen(Qt.NoPen), QBrush(QColor(0, 255, 100, 200)))
+        self.anim_marker.setZValue(15)
+        self.anim_marker.hide()
+        
+        self.anim_label = self.scene.addText("")
+        self.anim_label.setPos(20, 20)
+        self.anim_label.setDefaultTextColor(QColor(0, 255, 100))
+        self.anim_label.setZValue(15)
+        self.anim_label.hide()
+        
+        # Set up scene with a reasonable default view
+        self.fitInView(QRectF(0, 0, width, height), Qt.KeepAspectRatio)
+        
+    def set_anchor_points(self, anchor_points):
+        # Anchor items only need rebuilding when an anchor actually moved or
+        # changed, not on every step/interpolation tweak
+        state = [(p.index, p.x, p.y, p.original_x, p.original_y, p.text) for p in anchor_points]
+        if anchor_points is not self.anchor_points or state != self.anchor_state:
+            self.anchor_points = anchor_points
+            self.anchor_state = state
+            self.anchors_dirty = True
+        self.draw_scene()
+        
+    def set_path(self, preview):
+        # preview comes from path_preview, nothing left to compute here. From
+        # path_columns it has no polylines yet, the old ones stay up until
+        # PathJob delivers them
+        self.path_xs = preview["xs"]
+        self.path_ys = preview["ys"]
+        self.path_times = preview["times"]
+        if "paths" in preview:
+            self.lod_paths = preview["paths"]
+            self.path_dirty = True
+        # The path can change under a running animation now that it is
+        # recomputed in the background
+        self.animation_index = min(self.animation_index, max(0, len(self.path_times) - 1))
+        
+    def draw_scene(self):
+        # Bring the scene in line with the current data, rebuilding only what changed
+        if self.grid_size != (self.width, self.height):
+            self.build_grid()
+        if self.path_dirty:
+            self.build_path()
+        if self.anchors_dirty:
+            self.build_anchors()
+        self.update_marker()
+        
+    def build_grid(self):
+        for item in self.grid_items:
+            self.scene.removeItem(item)
+        self.grid_items = []
+        self.grid_size = (self.width, self.height)
+        
+        # Draw grid
+        grid_pen = QPen(QColor(80, 80, 80))
+        grid_pen.setWidth(1)
+        
+        # Draw only major grid lines (every 500 units)
+        for x in range(0, self.width + 1, 500):
+            self.grid_items.append(self.scene.addLine(x, 0, x, self.height, grid_pen))
+            text = self.scene.addText(str(x))
+            text.setPos(x - 10, self.height - 30)
+            text.setDefaultTextColor(QColor(200, 200, 200))
+            text.setZValue(10)
+            self.grid_items.append(text)
+        
+        for y in range(0, self.height + 1, 500):
+            self.grid_items.append(self.scene.addLine(0, y, self.width, y, grid_pen))
+            text = self.scene.addText(str(y))
+            text.setPos(10, y - 15)
+            text.setDefaultTextColor(QColor(200, 200, 200))
+            text.setZValue(10)
+            self.grid_items.append(text)
+        
+        # Draw origin
+        origin = self.scene.addRect(0, 0, 5, 5, QPen(Qt.NoPen), QBrush(QColor(255, 100, 100)))
+        origin.setZValue(10)
+        self.grid_items.append(origin)
+        
+    def build_path(self):
+        self.path_dirty = False
+        self.update_path_lod(force=True)
+        
+    def current_lod_level(self):
+        # Coarsest level whose error stays under half a screen pixel,
+        # -1 means every sample (zoomed in past the finest level)
+        tolerance = 0.5 / (self.transform().m11() or 1.0)
+        level = -1
+        for i, level_tolerance in enumerate(LOD_LEVELS):
+            if level_tolerance <= tolerance:
+                level = i
+        return level
+        
+    def update_path_lod(self, force=False):
+        level = self.current_lod_level()
+        if level == self.lod_level and not force:
+            return
+        self.lod_level = level
+        self.path_item.setPath(self.lod_paths.get(level, QPainterPath()))
+        
+    def build_anchors(self):
+        self.anchors_dirty = False
+        for item in self.anchor_items:
+            self.scene.removeItem(item)
+        self.anchor_items = []
+        
+        for point in self.anchor_points:
+            # Draw original position
+            orig = self.scene.addEllipse(
+                point.original_x - 3, 
+                point.original_y - 3, 
+                6, 6, 
+                QPen(Qt.NoPen), 
+                QBrush(QColor(100, 100, 100, 150)))
+            orig.setZValue(5)
+            
+            # Draw current position
+            curr = self.scene.addEllipse(
+                point.x - 5, 
+                point.y - 5, 
+                10, 10, 
+                QPen(Qt.NoPen), 
+                QBrush(QColor(255, 87, 51, 200)))
+            curr.setZValue(10)
+            
+            # Draw connection line
+            line = self.scene.addLine(
+                point.original_x, 
+                point.original_y, 
+                point.x, 
+                point.y, 
+                QPen(QColor(255, 200, 0), 1))
+            line.setZValue(1)
+            
+            # Draw text label
+            text = self.scene.addText(f"{point.index+1} ({point.x},{point.y}): {point.text} ")
+            text.setPos(point.x + 10, point.y - 15)
+            text.setDefaultTextColor(Qt.black)
+            text.setZValue(10)
+            
+            self.anchor_items.extend((orig, curr, line, text))
+            
+    def update_marker(self):
+        # Current animation position if running, O(1) per tick
+        if self.animation_running and len(self.path_times):
+            i = self.animation_index
+            self.anim_marker.setPos(self.path_xs[i], self.path_ys[i])
+            self.anim_label.setPlainText(
+                f"Frame: {i+1}/{len(self.path_times)}  "
+                f"{format_time(int(self.path_times[i]))} ({self.playback_rate:g}x)")
+            self.anim_marker.show()
+            self.anim_label.show()
+        else:
+            self.anim_marker.hide()
+            self.anim_label.hide()
+            
+    def wheelEvent(self, event: QWheelEvent):
+        zoom_factor = 1.2
+        if event.angleDelta().y() > 0:
+            # Zoom in
+            self.zoom_level *= zoom_factor
+            self.scale(zoom_factor, zoom_factor)
+        else:
+            # Zoom out
+            self.zoom_level /= zoom_factor
+            self.scale(1/zoom_factor, 1/zoom_factor)
+        self.update_path_lod()
+            
+    def keyPressEvent(self, event):
+        if event.key() == Qt.Key_R:
+            self.fitInView(QRectF(0, 0, self.width, self.height), Qt.KeepAspectRatio)
+            self.zoom_level = 1.0
+            self.update_path_lod()
+        super().keyPressEvent(event)
+        
+    def start_animation(self):
+        if len(self.path_times):
+            self.animation_index = 0
+            self.animation_start = int(self.path_times[0])
+            self.animation_clock.start()
+            self.animation_running = True
+            self.animation_timer.start(self.animation_speed)
+            self.update_marker()
+            
+    def animation_time(self):
+        # Subtitle time (centiseconds) the preview should be showing right now
+        return self.animation_start + self.animation_clock.elapsed() * self.playback_rate / 10
+        
+    def set_playback_rate(self, rate):
+        # Rebase the clock so changing speed doesn't jump the marker
+        if self.animation_running:
+            self.animation_start = self.animation_time()
+            self.animation_clock.restart()
+        self.playback_rate = rate
+        self.update_marker()
+            
+    def stop_animation(self):
+        self.animation_running = False
+        self.animation_timer.stop()
+        self.update_marker()
+
+    def animate_snake(self):
+        # Show the last sample at or before the clock; samples in between are
+        # skipped when ticks arrive late, so playback never drifts
+        now = self.animation_time()
+        if len(self.path_times) == 0 or now > self.path_times[-1]:
+            self.stop_animation()
+            return
+        self.animation_index = max(0, int(np.searchsorted(self.path_times, now, side='right')) - 1)
+        self.update_marker()
+
+
+class SnakeGeneratorUI(QMainWindow):
+    def __init__(self, input_file, output_file, width=2560, height=1440):
+        super().__init__()
+        self.input_file = input_file
+        self.output_file = output_file
+        self.width = width
+        self.height = height
+        self.anchor_points = []
+        self.path_segments_data = []
+        
+        # Background recomputation: parameter changes restart the debounce
+        # timer, the path is then sampled by a single worker thread
+        self.path_generation = 0
+        self.applied_generation = 0
+        # Sampled segments, so only segments that actually changed are resampled
+        self.segment_cache = SegmentCache()
+        # Parsed lines of the input file, so a reload only parses edited lines
+        self.parse_cache = {}
+        
+        # Live reload: QFileSystemWatcher uses inotify on Linux and polls
+        # where there is no native notification
+        self.watcher = QFileSystemWatcher(self)
+        self.watcher.fileChanged.connect(self.input_file_changed)
+        self.watch_timer = QTimer(self)
+        self.watch_timer.setSingleShot(True)
+        self.watch_timer.setInterval(WATCH_DELAY)
+        self.watch_timer.timeout.connect(self.watched_reload)
+        # (generation, message) to show once that path is applied, instead
+        # of the zoom status
+        self.path_status = None
+        self.path_pool = QThreadPool(self)
+        self.path_pool.setMaxThreadCount(1)
+        self.recompute_timer = QTimer(self)
+        self.recompute_timer.setSingleShot(True)
+        self.recompute_timer.setInterval(RECOMPUTE_DELAY)
+        self.recompute_timer.timeout.connect(self.start_path_job)
+        
+        self.setWindowTitle("Snake Subtitle Generator")
+        self.setGeometry(100, 100, 1200, 800)
+        
+        # Create toolbar
+        toolbar = QToolBar("Tools")
+        self.addToolBar(toolbar)
+        
+        # Zoom actions
+        zoom_in_action = QAction("Zoom In", self)
+        zoom_in_action.setShortcut(QKeySequence.ZoomIn)
+        zoom_in_action.triggered.connect(self.zoom_in)
+        toolbar.addAction(zoom_in_action)
+        
+        zoom_out_action = QAction("Zoom Out", self)
+        zoom_out_action.setShortcut(QKeySequence.ZoomOut)
+        zoom_out_action.triggered.connect(self.zoom_out)
+        toolbar.addAction(zoom_out_action)
+        
+        reset_zoom_action = QAction("Reset View", self)
+        reset_zoom_action.setShortcut("R")
+        reset_zoom_action.triggered.connect(self.reset_view)
+        toolbar.addAction(reset_zoom_action)
+        
+        # Create status bar
+        self.status_bar = QStatusBar()
+        self.setStatusBar(self.status_bar)
+        
+        # Create main layout
+        main_widget = QWidget()
+        main_layout = QHBoxLayout(main_widget)
+        
+        # Create preview area
+        preview_group = QGroupBox("Preview (Drag to pan, Mouse wheel to zoom)")
+        preview_layout = QVBoxLayout()
+        self.preview = ZoomableGraphicsView(self.width, self.height)
+        preview_layout.addWidget(self.preview)
+        preview_group.setLayout(preview_layout)
+        
+        # Create controls area
+        controls_group = QGroupBox("Controls")
+        controls_layout = QVBoxLayout()
+        
+        # Resolution settings
+        res_layout = QHBoxLayout()
+        res_layout.addWidget(QLabel("Width:"))
+        self.width_spin = QDoubleSpinBox()
+        self.width_spin.setRange(100, 10000)
+        self.width_spin.setValue(self.width)
+        self.width_spin.valueChanged.connect(self.update_resolution)
+        res_layout.addWidget(self.width_spin)
+        
+        res_layout.addWidget(QLabel("Height:"))
+        self.height_spin = QDoubleSpinBox()
+        self.height_spin.setRange(100, 10000)
+        self.height_spin.setValue(self.height)
+        self.height_spin.valueChanged.connect(self.update_resolution)
+        res_layout.addWidget(self.height_spin)
+        controls_layout.addLayout(res_layout)
+        
+        # Interpolation settings
+        controls_layout.addWidget(QLabel("Interpolation:"))
+        self.interpolation_combo = QComboBox()
+        self.interpolation_combo.addItems(["Linear", "Bézier"])
+        self.interpolation_combo.setCurrentIndex(1)
+        self.interpolation_combo.currentIndexChanged.connect(self.schedule_path_update)
+        controls_layout.addWidget(self.interpolation_combo)
+        
+        # Step size
+        controls_layout.addWidget(QLabel("Step Size (seconds):"))
+        self.step_spin = QDoubleSpinBox()
+        self.step_spin.setRange(0.01, 1.0)
+        self.step_spin.setValue(0.1)
+        self.step_spin.setSingleStep(0.01)
+        self.step_spin.valueChanged.connect(self.schedule_path_update)
+        controls_layout.addWidget(self.step_spin)
+        
+        # Frame-locked sampling
+        controls_layout.addWidget(QLabel("Video FPS (overrides step size):"))
+        self.fps_spin = QDoubleSpinBox()
+        self.fps_spin.setRange(0, 240)
+        self.fps_spin.setDecimals(3)
+        self.fps_spin.setSpecialValueText("Off")
+        self.fps_spin.setValue(0)
+        self.fps_spin.valueChanged.connect(self.schedule_path_update)
+        controls_layout.addWidget(self.fps_spin)
+        
+        controls_layout.addWidget(QLabel("Sample every Nth frame:"))
+        self.every_spin = QSpinBox()
+        self.every_spin.setRange(1, 60)
+        self.every_spin.setValue(1)
+        self.every_spin.valueChanged.connect(self.schedule_path_update)
+        controls_layout.addWidget(self.every_spin)
+        
+        # Display mode
+        controls_layout.addWidget(QLabel("Display Mode:"))
+        self.mode_combo = QComboBox()
+        self.mode_combo.addItems([
+            "Sequential (each point disappears)", 
+            "Persistent (points remain visible)"
+        ])
+        controls_layout.addWidget(self.mode_combo)
+        
+        # Point duration
+        controls_layout.addWidget(QLabel("Point Duration (seconds):"))
+        self.duration_spin = QDoubleSpinBox()
+        self.duration_spin.setRange(0.01, 1.0)
+        self.duration_spin.setValue(0.1)
+        self.duration_spin.setSingleStep(0.01)
+        controls_layout.addWidget(self.duration_spin)
+        
+        # Adaptive sampling
+        controls_layout.addWidget(QLabel("Adaptive Tolerance (px):"))
+        self.adaptive_spin = QDoubleSpinBox()
+        self.adaptive_spin.setRange(0, 50)
+        self.adaptive_spin.setSingleStep(0.5)
+        self.adaptive_spin.setSpecialValueText("Off")
+        self.adaptive_spin.setValue(0)
+        self.adaptive_spin.setToolTip("Only export the points needed to stay within this many pixels of the path,\n"
+                                      "joined with \\move. Sequential mode only, with a point duration no longer\n"
+                                      "than the step size (otherwise the dropped points would be visible).")
+        controls_layout.addWidget(self.adaptive_spin)
+        
+        # Text mode
+        controls_layout.addWidget(QLabel("Text Mode:"))
+        self.text_mode_combo = QComboBox()
+        self.text_mode_combo.addItems([
+            "Use first point's text for all", 
+            "Use each point's individual text"
+        ])
+        controls_layout.addWidget(self.text_mode_combo)
+        
+        # Incremental export
+        self.incremental_check = QCheckBox("Only rewrite changed segments")
+        self.incremental_check.setToolTip("Keeps a .manifest.json next to the output and copies the events of\n"
+                                          "segments that didn't change from the previous export.")
+        controls_layout.addWidget(self.incremental_check)
+        
+        # Buttons
+        # Playback speed
+        controls_layout.addWidget(QLabel("Preview Speed:"))
+        self.speed_combo = QComboBox()
+        self.speed_combo.addItems([f"{speed:g}x" for speed in PLAYBACK_SPEEDS])
+        self.speed_combo.setCurrentIndex(PLAYBACK_SPEEDS.index(1.0))
+        self.speed_combo.currentIndexChanged.connect(
+            lambda i: self.preview.set_playback_rate(PLAYBACK_SPEEDS[i]))
+        controls_layout.addWidget(self.speed_combo)
+        
+        self.preview_btn = QPushButton("Preview Animation")
+        self.preview_btn.clicked.connect(self.preview_animation)
+        controls_layout.addWidget(self.preview_btn)
+        
+        self.generate_btn = QPushButton("Generate ASS File")
+        self.generate_btn.clicked.connect(self.generate_ass)
+        controls_layout.addWidget(self.generate_btn)
+        
+        self.reload_btn = QPushButton("Reload Input file")
+        self.reload_btn.clicked.connect(self.reload_input_file)
+        controls_layout.addWidget(self.reload_btn)
+        
+        self.watch_check = QCheckBox("Reload when the input file changes")
+        self.watch_check.toggled.connect(self.set_watching)
+        controls_layout.addWidget(self.watch_check)
+        
+        
+        self.reset_btn = QPushButton("Reset Positions")
+        self.reset_btn.clicked.connect(self.reset_positions)
+        controls_layout.addWidget(self.reset_btn)
+        
+        controls_group.setLayout(controls_layout)
+        
+        # Add to main layout
+        main_layout.addWidget(preview_group, 3)
+        main_layout.addWidget(controls_group, 1)
+        
+        self.setCentralWidget(main_widget)
+        
+        # Load input file
+        self.load_input_file()
+        
+    def zoom_in(self):
+        self.preview.zoom_level *= 1.2
+        self.preview.scale(1.2, 1.2)
+        self.preview.update_path_lod()
+        self.update_status()
+        
+    def zoom_out(self):
+        self.preview.zoom_level /= 1.2
+        self.preview.scale(1/1.2, 1/1.2)
+        self.preview.update_path_lod()
+        self.update_status()
+        
+    def reset_view(self):
+        self.preview.fitInView(QRectF(0, 0, self.preview.width, self.preview.height), Qt.KeepAspectRatio)
+        self.preview.zoom_level = 1.0
+        self.preview.update_path_lod()
+        self.update_status()
+        
+    def update_status(self):
+        self.status_bar.showMessage(f"Zoom: {self.preview.zoom_level:.1f}x | Press R to reset view")
+        
+    def update_resolution(self):
+        self.width = int(self.width_spin.value())
+        self.height = int(self.height_spin.value())
+        self.preview.width = self.width
+        self.preview.height = self.height
+        self.preview.setSceneRect(0, 0, self.width, self.height)
+        self.reset_view()
+        self.schedule_path_update()
+        
+    def load_input_file(self):
+        try:
+            anchor_points, other_lines = load_anchors(self.input_file, self.parse_cache)
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not load input file:\n{str(e)}")
+            return
+        
+        if len(anchor_points) < 2:
+            QMessageBox.warning(self, "Warning", "Need at least 2 anchor points")
+            return
+        
+        self.anchor_points = anchor_points
+        self.other_lines = other_lines
+        # Update preview
+        self.update_path()
+        
+    def current_settings(self):
+        return SnakeSettings(
+            interpolation='bezier' if self.interpolation_combo.currentText() == "Bézier" else 'linear',
+            step=max(1, seconds_to_ticks(self.step_spin.value())),
+            fps=self.fps_spin.value() or None,
+            every=self.every_spin.value(),
+            persistent=self.mode_combo.currentIndex() == 1,
+            duration=seconds_to_ticks(self.duration_spin.value()),
+            per_point_text=self.text_mode_combo.currentIndex() == 1,
+            tolerance=self.adaptive_spin.value() or None
+        )
+        
+    def update_path(self):
+        # Sample right away on the GUI thread, for when the result is needed
+        # now. Export and playback only need the samples, the preview
+        # polylines are still built by a PathJob
+        if len(self.anchor_points) < 2:
+            return
+        self.recompute_timer.stop()
+        self.path_generation += 1  # anything still running is stale now
+            
+        # Calculate path points for each segment
+        path_segments = split_segments(self.anchor_points)
+        settings = self.current_settings()
+        segments_data = sample_segments(path_segments, settings, self.segment_cache)
+        self.apply_path(self.path_generation, segments_data, path_columns(segments_data))
+        job = PathJob(self.path_generation, path_segments, settings, self.is_current_generation,
+                      segments_data=segments_data)
+        job.signals.done.connect(self.apply_path)
+        self.path_pool.start(job)
+        
+    def schedule_path_update(self):
+        # Restarting the timer coalesces a burst of changes into one job
+        self.recompute_timer.start()
+        
+    def path_update_pending(self):
+        return self.recompute_timer.isActive() or self.applied_generation != self.path_generation
+        
+    def is_current_generation(self, generation):
+        return generation == self.path_generation
+        
+    def start_path_job(self):
+        if len(self.anchor_points) < 2:
+            return
+        self.path_generation += 1
+        job = PathJob(self.path_generation, split_segments(self.anchor_points),
+                      self.current_settings(), self.is_current_generation, self.segment_cache)
+        job.signals.done.connect(self.apply_path)
+        self.path_pool.start(job)
+        
+    def apply_path(self, generation, segments_data, preview):
+        if generation != self.path_generation:
+            return  # a newer change arrived while this one was computing
+        self.applied_generation = generation
+        self.path_segments_data = segments_data # Store data for generation
+
+        # Update preview, nothing expensive is left for the GUI thread
+        self.preview.set_anchor_points(self.anchor_points)
+        self.preview.set_path(preview)
+        self.preview.draw_scene()
+        if self.path_status is not None and self.path_status[0] == generation:
+            self.status_bar.showMessage(self.path_status[1])
+            self.path_status = None
+        else:
+            self.update_status()
+        
+    def preview_animation(self):
+        if not self.path_segments_data or self.path_update_pending():
+            self.update_path()
+            
+        if self.preview.animation_running:
+            self.preview.stop_animation()
+            self.preview_btn.setText("Preview Animation")
+        else:
+            self.preview.start_animation()
+            self.preview_btn.setText("Stop Animation")
+            
+    def reset_positions(self):
+        for point in self.anchor_points:
+            point.x = point.original_x
+            point.y = point.original_y
+        self.update_path()
+        
+    def generate_ass(self):
+        if not self.anchor_points or not self.path_segments_data or self.path_update_pending():
+            self.update_path()
+            
+        try:
+            # Format the snake events segment by segment straight into the output file
+            settings = self.current_settings()
+            if self.incremental_check.isChecked():
+                segments = [(segment_key(segment_data["anchors"], settings), segment_data)
+                            for segment_data in self.path_segments_data]
+                _, reused = write_incremental(
+                    self.output_file, self.other_lines, segments,
+                    lambda changed: (segment_lines(segment_data, settings) for segment_data in changed))
+                QMessageBox.information(
+                    self, "Success",
+                    f"Generated {self.output_file} successfully!\n"
+                    f"{len(segments) - reused} of {len(segments)} segments rewritten.")
+                return
+            
+            snake_lines = (line for segment_data in self.path_segments_data
+                           for line in segment_lines(segment_data, settings))
+            write_output(self.output_file, self.other_lines, snake_lines)
+
+            QMessageBox.information(self, "Success", f"Generated {self.output_file} successfully!")
+            
+        except Exception as e:
+            QMessageBox.critical(self, "Error", f"Could not generate output file:\n{str(e)}")
+
+    def reload_input_file(self):
+        # 1. Stop any running animation
+        self.preview.stop_animation()
+        
+        # 2. Clear current anchor points
+        self.anchor_points = []
+        self.path_segments_data = []
+        
+        # 3. Re-run the file loading process, this updates the path too
+        self.load_input_file()  # Existing function
+        
+    def set_watching(self, enabled):
+        if enabled:
+            self.watcher.addPath(self.input_file)
+            self.status_bar.showMessage(f"Watching {self.input_file}")
+        else:
+            # A reload that is still waiting would add the file back
+            self.watch_timer.stop()
+            if self.watcher.files():
+                self.watcher.removePaths(self.watcher.files())
+            
+    def input_file_changed(self, path):
+        # Restarting the timer waits for the editor to finish saving
+        self.watch_timer.start()
+        
+    def watched_reload(self):
+        if not self.watch_check.isChecked():
+            return
+        # Saving by replacing the file drops it from the watcher, add it back
+        if self.input_file not in self.watcher.files():
+            if not os.path.exists(self.input_file):
+                self.watch_timer.start()  # still being replaced, try again
+                return
+            self.watcher.addPath(self.input_file)
+            
+        # No dialogs here, a half saved file shouldn't interrupt editing
+        try:
+            anchor_points, other_lines = load_anchors(self.input_file, self.parse_cache)
+        except (OSError, ValueError) as e:
+            self.status_bar.showMessage(f"Could not reload input file: {e}")
+            return
+        if len(anchor_points) < 2:
+            self.status_bar.showMessage("Reload skipped: need at least 2 anchor points")
+            return
+            
+        self.anchor_points = anchor_points
+        self.other_lines = other_lines
+        # Skip the debounce, the segment cache keeps this to the edited segments
+        self.recompute_timer.stop()
+        self.start_path_job()
+        self.path_status = (self.path_generation, f"Reloaded {self.input_file}")
+
+
+def run(input_file, output_file, width=2560, height=1440):
+    app = QApplication(sys.argv)
+    app.setStyle("Fusion")
+    
+    window = SnakeGeneratorUI(input_file, output_file, width, height)
+    window.show()
+    
+    return app.exec_()